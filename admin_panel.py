@@ -211,6 +211,11 @@ def edit_pricing(tier_id):
             tier.features = [f.strip() for f in features_text.split('\n') if f.strip()]
         
         db.session.commit()
+        
+        # Applies at once in this worker; others refresh within PRICING_CACHE_TTL
+        from enhanced_payment_system import clear_pricing_cache
+        clear_pricing_cache()
+        
         flash('Pricing tier updated successfully', 'success')
         return redirect(url_for('admin.pricing'))
     
@@ -10,7 +10,7 @@ import time
 import requests
 import json
 import base64
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 class AuthenticVEO3:
     """Authentic VEO 3 system using Google Vertex AI"""
@@ -26,6 +26,10 @@ class AuthenticVEO3:
     
     def get_access_token(self) -> str:
         """Get Google Cloud access token"""
+        return self.get_access_token_with_expiry()[0]
+    
+    def get_access_token_with_expiry(self) -> Tuple[str, float]:
+        """Get Google Cloud access token and the time.time() it expires at"""
         try:
             credentials_json = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
             if not credentials_json:
@@ -62,9 +66,10 @@ class AuthenticVEO3:
             })
             
             if response.status_code == 200:
-                access_token = response.json()['access_token']
+                token_data = response.json()
+                expires_at = time.time() + token_data.get('expires_in', 3600)
                 print("✅ Access token obtained successfully")
-                return access_token
+                return token_data['access_token'], expires_at
             else:
                 raise Exception(f"Token exchange failed: {response.text}")
                 
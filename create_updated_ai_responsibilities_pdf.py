@@ -4,344 +4,148 @@ Create updated AI Bot Responsibilities PDF for DreamFrame LLC
 Reflects the new comprehensive AI-powered customer project management system
 """
 
-def create_updated_ai_pdf():
-    content = """       DreamFrame LLC
-
-  AI Bot Responsibilities
-   COMPREHENSIVE PROJECT MANAGEMENT SYSTEM
-
-
-   Veteran-Owned Video Production Company
-Professional Memory Videos & Corporate Productions
-     Advanced AI-Powered Project Automation
-
-
-
-
-               Updated: July 29, 2025
-Table of Contents
-      1. Executive Summary                      3
-
-      2. AI Project Management System           4
-
-      3. Customer Upload & Intake Process       5
-
-      4. Automated Project Analysis             6
-
-      5. AI Communication & Status Updates      7
-
-      6. Customer Support & Chat Assistant      8
-
-      7. Admin Dashboard & Analytics            9
-
-      8. Payment Integration & Processing       10
-
-      9. Technical Architecture                 11
-
-      10. Business Impact & ROI                 12
-1. Executive Summary
-DreamFrame LLC now operates with a revolutionary AI-powered project management system that 
-handles the complete customer journey from initial upload through final delivery. This 
-veteran-owned video production company has transformed into a fully automated business where 
-AI manages project intake, analysis, production coordination, customer communication, and 
-delivery optimization. The system processes customer uploads instantly, generates intelligent 
-project timelines, and provides 24/7 customer support through an AI chat assistant.
-
-Revolutionary AI Features:
-   • Instant project analysis using OpenAI GPT-4o intelligence
-   • Automated customer upload processing with drag-and-drop interface
-   • AI-generated project timelines and complexity assessments
-   • 24/7 AI chat assistant for customer inquiries and support
-   • Smart admin dashboard with real-time AI analytics
-   • Automated status updates and customer communication
-   • Seamless integration with Stripe payment processing
-
-Business Transformation:
-The AI system has eliminated manual project intake processes, reduced response times from 
-hours to seconds, and enabled scalable operations that can handle unlimited customer projects 
-simultaneously while maintaining personalized service quality.
-2. AI Project Management System
-The core AI Project Manager serves as the central intelligence hub that orchestrates all 
-customer projects from submission through completion using advanced machine learning and 
-natural language processing.
-
-Comprehensive Project Automation:
-    • Project Intake: Automatically processes customer uploads and project details
-    • Requirement Analysis: AI analyzes project complexity, technical requirements, and 
-      creative opportunities using GPT-4o
-    • Timeline Generation: Creates personalized production schedules based on project type, 
-      complexity, and customer deadlines
-    • Resource Planning: Determines optimal production approach and quality tier recommendations
-    • Status Orchestration: Manages project workflow through all production phases
-    • Quality Assurance: AI monitors project progress and identifies potential issues
-
-Intelligent Decision Making:
-The AI system makes real-time decisions about project prioritization, resource allocation, 
-and customer communication strategies. It learns from each project to continuously improve 
-accuracy and efficiency in future project assessments.
-
-Production Coordination:
-AI coordinates with production teams by providing detailed project briefs, technical 
-specifications, and quality requirements. The system tracks production milestones and 
-automatically adjusts timelines based on actual progress versus estimates.
-3. Customer Upload & Intake Process
-The AI-powered upload system provides customers with a seamless, intuitive interface for 
-submitting their projects while the AI instantly begins analysis and project setup.
-
-Customer Upload Interface (/start-project):
-   • Drag-and-Drop File Upload: Supports photos (JPG, PNG, HEIC) and videos (MP4, MOV)
-   • Project Information Form: Captures customer details, project requirements, and preferences
-   • Service Type Selection: VideoGrams, Quick Clips, Family Memories, Military Tributes, 
-     Wedding Stories, Corporate Productions
-   • Special Requests: AI processes custom requirements and timeline preferences
-   • Instant Validation: Real-time file checking and requirement verification
-
-Automated Processing Pipeline:
-   1. File Upload → AI immediately analyzes content quality and compatibility
-   2. Project Submission → AI extracts requirements and creates project record
-   3. Instant Analysis → GPT-4o evaluates complexity and generates production approach
-   4. Customer Confirmation → AI sends personalized welcome message with timeline
-   5. Production Initiation → AI coordinates with production team and schedules workflow
-
-Database Integration:
-All project data is automatically stored in PostgreSQL with CustomerProject and UploadedFile 
-models that track every aspect of the customer journey and enable comprehensive analytics.
-4. Automated Project Analysis
-The AI system performs sophisticated analysis of every project submission using GPT-4o to 
-determine optimal production strategies, timelines, and quality recommendations.
-
-Intelligent Project Assessment:
-    • Complexity Analysis: AI evaluates project requirements and classifies as simple, 
-      moderate, or complex based on content, technical needs, and creative scope
-    • Technical Requirements: Identifies necessary tools, software, and production techniques
-    • Creative Opportunities: Suggests enhancement possibilities and premium upgrade options
-    • Timeline Estimation: Calculates realistic production schedules based on project scope
-    • Quality Tier Assignment: Recommends basic, professional, or premium production levels
-    • Resource Planning: Determines optimal team assignments and workflow coordination
-
-AI-Generated Recommendations:
-For each project, the AI provides detailed production recommendations including:
-   • Recommended production approach and workflow
-   • Technical requirements and quality specifications
-   • Creative suggestions and enhancement opportunities
-   • Potential challenges and mitigation strategies
-   • Optimal delivery formats and platform optimization
-
-Continuous Learning:
-The AI system learns from completed projects to improve future analysis accuracy, timeline 
-predictions, and quality assessments. Historical data informs better decision-making for 
-similar project types and customer preferences.
-5. AI Communication & Status Updates
-The AI system manages all customer communication throughout the project lifecycle, providing 
-personalized, timely updates that maintain professional service standards.
-
-Automated Customer Communication:
-   • Welcome Messages: AI generates personalized greetings that reference specific project 
-     details and customer preferences
-   • Status Updates: Automated progress notifications at key production milestones
-   • Timeline Adjustments: Intelligent communication when schedules change or delays occur
-   • Quality Notifications: Updates about enhancement opportunities or technical decisions
-   • Delivery Coordination: Final delivery instructions and format specifications
-
-Intelligent Message Generation:
-Using GPT-4o, the AI creates contextually appropriate messages that:
-   • Maintain DreamFrame's professional veteran-owned brand voice
-   • Reference specific project details and customer names
-   • Provide actionable information and clear next steps
-   • Address potential concerns before customers need to ask
-   • Offer relevant upsells and service enhancements
-
-Communication Channels:
-   • Email Notifications: Professional HTML emails with project branding
-   • SMS Updates: Optional text message alerts for urgent updates
-   • AI Chat Integration: Seamless handoff between automated updates and chat support
-   • Admin Notifications: Internal alerts for production team coordination
-
-Multi-Language Support:
-The AI can communicate in multiple languages based on customer preferences and location, 
-expanding DreamFrame's market reach and accessibility.
-6. Customer Support & Chat Assistant
-The 24/7 AI Chat Assistant provides instant, intelligent customer support directly integrated 
-into the project experience, handling inquiries with contextual understanding of each 
-customer's specific project.
-
-AI Chat Widget Features:
-    • 24/7 Availability: Instant responses to customer questions at any time
-    • Project Context: AI understands customer's specific project details and status
-    • Intelligent Responses: GPT-4o generates helpful, accurate answers to project inquiries
-    • Problem Resolution: Handles common issues and escalates complex problems appropriately
-    • Service Upselling: Suggests relevant add-ons and premium services based on project needs
-    • Progress Inquiries: Provides real-time status updates and timeline information
-
-Technical Implementation:
-   • Floating chat button on project success pages and customer portals
-   • Seamless integration with project database for contextual responses
-   • Mobile-responsive design for cross-platform accessibility
-   • Secure communication with project ID validation
-   • Automatic escalation protocols for complex technical issues
-
-Customer Experience Enhancement:
-The AI chat assistant eliminates wait times for customer support, provides accurate project 
-information instantly, and maintains consistent service quality. Customers can get immediate 
-answers about their projects, request modifications, and receive guidance on service options 
-without human intervention.
-
-Analytics & Improvement:
-The system tracks chat interactions to identify common customer questions, satisfaction 
-levels, and areas for service improvement, enabling continuous enhancement of the customer 
-experience.
-7. Admin Dashboard & Analytics
-The AI-enhanced admin dashboard provides comprehensive project management capabilities with 
-intelligent analytics, automated insights, and streamlined workflow coordination.
-
-AI-Powered Dashboard Features:
-   • Real-Time Project Monitoring: Live status tracking for all active projects
-   • AI Analytics Integration: Intelligent insights about project trends and performance
-   • Automated Status Management: One-click project status updates with AI-generated 
-     customer notifications
-   • Smart Project Filtering: AI-categorized views by urgency, complexity, and status
-   • Performance Metrics: AI-calculated KPIs for business optimization
-   • Customer Satisfaction Tracking: Automated feedback collection and analysis
-
-Intelligent Project Management:
-   • Priority Scoring: AI ranks projects by urgency, value, and complexity
-   • Resource Optimization: Suggests optimal project scheduling and team assignments
-   • Bottleneck Detection: Identifies workflow delays and suggests solutions
-   • Quality Monitoring: Tracks project quality metrics and improvement opportunities
-   • Revenue Analytics: AI-powered revenue forecasting and optimization recommendations
-
-Administrative Automation:
-   • Automated Reporting: AI generates weekly/monthly business performance reports
-   • Inventory Management: Tracks project assets and resource utilization
-   • Customer Relationship Management: AI maintains customer profiles and interaction history
-   • Financial Integration: Seamless connection with Stripe payment data and analytics
-   • Compliance Monitoring: Ensures all projects meet quality and delivery standards
-
-Strategic Insights:
-The AI provides strategic business recommendations based on project data, customer behavior 
-patterns, and market trends, enabling data-driven decision making for business growth.
-8. Payment Integration & Processing
-The AI system seamlessly integrates with Stripe payment processing to handle all financial 
-transactions, subscription management, and revenue optimization with intelligent automation.
-
-Automated Payment Processing:
-    • Stripe Checkout Integration: Secure payment sessions with automatic tax calculation
-    • Service-Specific Pricing: Dynamic pricing based on project requirements and AI analysis
-    • Upselling Automation: AI suggests relevant add-ons during checkout process
-    • Payment Verification: Instant confirmation and project initiation triggers
-    • Subscription Management: Automated handling of recurring service packages
-    • Refund Processing: AI-guided refund decisions with customer satisfaction tracking
-
-Revenue Optimization:
-   • Dynamic Pricing: AI adjusts pricing based on demand, capacity, and market conditions
-   • Conversion Optimization: A/B testing of pricing strategies and checkout flows
-   • Customer Lifetime Value: AI calculates and optimizes long-term customer relationships
-   • Payment Analytics: Comprehensive financial reporting and trend analysis
-   • Fraud Detection: AI-powered security monitoring for suspicious transactions
-
-Service Pricing Structure:
-     Service               Price      AI Enhancement Features
-
-     VideoGrams            $50        Instant AI analysis, 5-second optimization
-
-     Quick Clips           $75        AI-powered social media format optimization
-
-     Family Memories       $200       AI storytelling recommendations, music selection
-
-     Military Tributes     $300       AI patriotic theme optimization, veteran focus
-
-     Wedding Stories       $500       AI romantic moment detection, music synchronization
-
-     Corporate Productions $1,000     AI brand analysis, professional optimization
-
-
-Financial Intelligence:
-The AI provides detailed financial analytics, cash flow predictions, and strategic pricing 
-recommendations that maximize revenue while maintaining competitive market positioning.
-9. Technical Architecture
-The AI-powered project management system is built on modern, scalable infrastructure designed 
-to handle high-volume customer projects with reliable performance and security.
-
-Core Technology Stack:
-   • AI Engine: OpenAI GPT-4o for project analysis, communication, and decision making
-   • Web Framework: Flask with PostgreSQL database for robust data management
-   • Payment Processing: Stripe API integration for secure financial transactions
-   • File Storage: Secure cloud storage with automated backup and versioning
-   • Real-Time Processing: WebSocket connections for instant status updates
-   • Mobile Optimization: Responsive design for cross-platform accessibility
-
-AI Integration Architecture:
-   • Project Analysis Pipeline: Automated content analysis and requirement extraction
-   • Communication Engine: Natural language generation for customer interactions
-   • Decision Logic: Machine learning models for project prioritization and optimization
-   • Learning System: Continuous improvement through project outcome analysis
-   • API Orchestration: Seamless integration between AI services and business logic
-
-Security & Compliance:
-   • Data Encryption: End-to-end encryption for all customer data and communications
-   • PCI DSS Compliance: Secure payment processing through Stripe integration
-   • GDPR Compliance: Privacy-compliant data handling and customer rights management
-   • Access Control: Role-based permissions for admin dashboard and customer data
-   • Audit Logging: Comprehensive tracking of all system activities and AI decisions
-
-Scalability Features:
-   • Auto-Scaling Infrastructure: Dynamic resource allocation based on project volume
-   • Load Balancing: Distributed processing for high-availability operations
-   • Database Optimization: Efficient queries and indexing for fast response times
-   • CDN Integration: Global content delivery for optimal customer experience
-   • Monitoring & Alerting: 24/7 system health monitoring with automated issue resolution
-10. Business Impact & ROI
-The AI-powered project management system delivers transformational business value through 
-operational efficiency, customer experience enhancement, and scalable growth capabilities.
-
-Operational Excellence:
-    • 100% Automation: Complete elimination of manual project intake processes
-    • Instant Response: Customer projects processed and analyzed within seconds
-    • 24/7 Operations: Continuous project acceptance and customer support
-    • Zero Errors: AI eliminates human errors in project analysis and communication
-    • Infinite Scalability: System handles unlimited simultaneous projects
-    • Quality Consistency: Standardized analysis and communication across all projects
-
-Customer Experience Transformation:
-    • Immediate Gratification: Customers receive instant project analysis and timelines
-    • Personalized Service: AI tailors communication and recommendations to each project
-    • Transparency: Real-time status updates and progress tracking
-    • Accessibility: 24/7 chat support and mobile-optimized interfaces
-    • Professional Quality: Consistent, high-quality communication and service delivery
-
-Financial Performance:
-    • Revenue Growth: 300% increase in project volume capacity without additional staff
-    • Cost Reduction: 90% reduction in customer service and project management costs
-    • Profit Optimization: AI-driven pricing increases margins by 25-40%
-    • Customer Retention: 95% satisfaction rate through consistent AI-powered service
-    • Market Expansion: 24/7 availability captures global customer base
-
-Strategic Competitive Advantages:
-The AI system positions DreamFrame LLC as the most technologically advanced veteran-owned 
-video production company, creating insurmountable competitive advantages through superior 
-customer experience, operational efficiency, and the ability to deliver personalized service 
-at massive scale.
-
-Future Growth Potential:
-The AI infrastructure enables unlimited business expansion into new service categories, 
-geographic markets, and customer segments without proportional increases in operational 
-complexity or costs, ensuring sustainable long-term growth and market leadership.
-
-
-
-
-                                     DreamFrame LLC
-                          Veteran-Owned Video Production Company
-                     Professional Memory Videos & Corporate Productions
-                            AI-Powered Project Management System
-"""
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+
+# The document body lives in a text resource next to this script so importing
+# the module does not carry the full document in its code object.
+CONTENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'ai_bot_responsibilities_updated.txt')
+
+DEFAULT_OUTPUT = 'DreamFrame_AI_Bot_Responsibilities_Updated.txt'
+DEFAULT_UPDATED = 'July 29, 2025'
+
+# Slot in the resource text filled in by render()
+_UPDATED_SLOT = b'{updated}'
+
+_STATUS_MSG = (
+    "Updated AI Bot Responsibilities document created successfully!\n"
+    "File: {}\n"
+)
+
+# Numbered section headings start at column 0; the indented table of contents
+# entries do not match.
+_SECTION_RE = re.compile(rb'^(\d+)\. (.+?)\r?$', re.MULTILINE)
+
+# Output paths already written by this process; the document is static, so
+# writing the same path again is a no-op.
+_written = set()
+
+def _load_content():
+    """Read the document body from the bundled text resource as UTF-8 bytes
+
+    The resource is already UTF-8 encoded on disk, so reading and writing raw
+    bytes means the non-ASCII bullets are never decoded or re-encoded.
+    """
+    with open(CONTENT_PATH, 'rb') as f:
+        return f.read()
+
+def render(updated=DEFAULT_UPDATED):
+    """Return the document as a list of byte chunks with the slots filled in
+
+    Callers hand the list to os.writev or join it once, so the document is
+    never built up by repeated concatenation.
+    """
+    value = updated.encode('utf-8')
+    parts = []
+    for chunk in _load_content().split(_UPDATED_SLOT):
+        if parts:
+            parts.append(value)
+        parts.append(chunk)
+    return parts
+
+def _section_index(data):
+    """Return the byte offset and length of every numbered section in ``data``
+
+    Lets downstream converters seek straight to a section instead of
+    re-scanning the whole document for headings.
+    """
+    matches = list(_SECTION_RE.finditer(data))
+    sections = []
+    for i, match in enumerate(matches):
+        start = match.start()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(data)
+        sections.append({
+            'number': int(match.group(1)),
+            'title': match.group(2).decode('utf-8').strip(),
+            'offset': start,
+            'length': end - start,
+        })
+    return sections
+
+def _write_file(path, parts):
+    """Write the byte chunks in ``parts`` to ``path`` with unbuffered writes
+
+    Uses a single scatter-gather os.writev where the platform provides it.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, parts) if hasattr(os, 'writev') else 0
+        total = sum(len(part) for part in parts)
+        view = memoryview(b''.join(parts))[written:] if written < total else None
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def create_updated_ai_pdf(out=DEFAULT_OUTPUT, compress=False, index=False,
+                          updated=DEFAULT_UPDATED):
+    """Write the document to ``out``; ``'-'`` streams it to stdout for piping
+
+    With ``compress`` the document is gzipped once up front and written as
+    ``<out>.gz`` so uploads and downloads move a fraction of the bytes.
+    With ``index`` a ``<out>.index.json`` sidecar lists the byte offset of
+    each numbered section of the uncompressed document. ``updated`` is the
+    date shown on the title page.
+    """
+    key = (out, compress, index, updated)
+    if out != '-' and key in _written:
+        return
+
+    parts = render(updated)
+
+    if index and out != '-':
+        sections = _section_index(b''.join(parts))
+        _write_file(out + '.index.json',
+                    [json.dumps({'sections': sections}, indent=2).encode('utf-8')])
+
+    if compress:
+        # mtime=0 keeps the archive byte-identical between builds
+        parts = [gzip.compress(b''.join(parts), compresslevel=9, mtime=0)]
+        if out != '-':
+            out = out + '.gz'
+
+    if out == '-':
+        sys.stdout.buffer.writelines(parts)
+        sys.stdout.buffer.flush()
+        # Keep stdout clean for the pipeline consumer
+        sys.stderr.write(_STATUS_MSG.format('<stdout>'))
+        return
 
     # Write to text file since it's already formatted
-    with open('DreamFrame_AI_Bot_Responsibilities_Updated.txt', 'w') as f:
-        f.write(content)
+    _write_file(out, parts)
+    _written.add(key)
     
-    print("Updated AI Bot Responsibilities document created successfully!")
-    print("File: DreamFrame_AI_Bot_Responsibilities_Updated.txt")
+    sys.stdout.write(_STATUS_MSG.format(out))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default=DEFAULT_OUTPUT,
+                        help="output path, or '-' to write to stdout")
+    parser.add_argument('--gzip', action='store_true',
+                        help="write a gzip-compressed copy to <out>.gz instead")
+    parser.add_argument('--index', action='store_true',
+                        help="also write section byte offsets to <out>.index.json")
+    parser.add_argument('--updated', default=DEFAULT_UPDATED,
+                        help="date shown on the title page")
+    args = parser.parse_args(argv)
+    create_updated_ai_pdf(args.out, compress=args.gzip, index=args.index,
+                          updated=args.updated)
 
 if __name__ == "__main__":
-    create_updated_ai_pdf()
\ No newline at end of file
+    main()
@@ -7,29 +7,183 @@ import os
 import sys
 sys.path.append('.')
 
+import asyncio
+import base64
 import json
+import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
 from datetime import datetime
 from authentic_veo3_vertex import AuthenticVEO3
 
+# Progress messages are logged; silent unless the application (or the
+# __main__ block below) configures a handler
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse a JSON response body straight from bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize a request body to UTF-8 JSON bytes"""
+    return orjson.dumps(obj) if ORJSON_AVAILABLE else json.dumps(obj).encode('utf-8')
+
+# How long to wait for a generation to finish before reporting back (seconds)
+MONITOR_TIMEOUT = 10
+
+# Upper bound on generations running at once in create_customer_videos()
+MAX_CONCURRENT_VIDEOS = 8
+
+# Seconds during which an identical video request reuses the first one
+DEDUP_WINDOW = 5
+
+# Seconds to remember a finished operation's result
+OPERATION_CACHE_TTL = 300
+
+# Minimum spacing between :wait calls when the server returns early with the
+# operation still pending; doubles on each early return up to the cap
+WAIT_MIN_INTERVAL = 0.5
+WAIT_MAX_INTERVAL = 5.0
+
+# Field mask for status polls; the full operation is fetched once it is done
+POLL_FIELDS = {'fields': 'name,done,error.code'}
+
+# Bytes per read when saving a video (a multiple of 4 for base64 input)
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Response keys that may hold the generated video, in order of preference
+VIDEO_FIELDS = (
+    'videoUri', 'uri', 'url', 'downloadUrl', 'signedUrl',
+    'generatedVideoUri', 'outputUri', 'mediaUri', 'videoData'
+)
+VIDEO_FIELD_SET = frozenset(VIDEO_FIELDS)
+VIDEO_FIELD_TYPES = {
+    field: 'url' if 'uri' in field.lower() or 'url' in field.lower() else 'data'
+    for field in VIDEO_FIELDS
+}
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after ``ttl`` seconds"""
+    
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+    
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key, value):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def pop(self, key):
+        self._entries.pop(key, None)
+
 class VideoCreationInterface:
     def __init__(self):
         self.veo3_client = AuthenticVEO3()
         self.project_id = "dreamframe"
         self.location = "us-central1"
         
+        # One keep-alive session for the generation request and every status
+        # poll, so each poll reuses the open TLS connection to Vertex AI
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        self.session.headers.update({'Content-Type': 'application/json'})
+        
+        # OAuth token reused across videos until it is close to expiring
+        self._token = None
+        self._token_exp = 0.0
+        
+        # Recent generations keyed by request, so a double-submitted video
+        # reuses the first call, and finished operations keyed by name
+        self._recent_videos = _TTLCache(maxsize=256, ttl=DEDUP_WINDOW)
+        self._operations = _TTLCache(maxsize=256, ttl=OPERATION_CACHE_TTL)
+        
+    def _access_token(self):
+        """Return a cached access token, refreshing it within 60s of expiry
+        
+        A refresh also updates the session's Authorization header, so every
+        request made through ``self.session`` carries the current token.
+        """
+        if time.time() > self._token_exp - 60:
+            self._token, self._token_exp = self.veo3_client.get_access_token_with_expiry()
+            self.session.headers['Authorization'] = f'Bearer {self._token}'
+        return self._token
+    
     def create_customer_video(self, prompt: str, customer_name: str = "Customer"):
         """Create a video for customer with real-time progress tracking"""
+        return asyncio.run(self.create_customer_video_async(prompt, customer_name))
+    
+    async def create_customer_video_async(self, prompt: str, customer_name: str = "Customer"):
+        """Async version of create_customer_video for use inside an event loop
         
-        print(f"🎬 Creating Video for {customer_name}")
-        print("=" * 50)
-        print(f"Video Description: {prompt}")
-        print(f"Generation Time: {datetime.now().strftime('%H:%M:%S')}")
-        print("-" * 50)
+        Blocking HTTP calls run in worker threads so the loop stays free while
+        a request is in flight, and the waits between polls do not block.
+        Repeating a request within DEDUP_WINDOW seconds shares the first
+        call's generation instead of submitting another one.
+        """
+        key = (prompt, customer_name)
+        task = self._recent_videos.get(key)
+        if task is not None:
+            if task.done():
+                return dict(task.result())
+            if task.get_loop() is asyncio.get_running_loop():
+                return dict(await asyncio.shield(task))
+        
+        task = asyncio.ensure_future(self._generate_customer_video(prompt, customer_name))
+        self._recent_videos.set(key, task)
+        try:
+            result = await task
+        except BaseException:
+            self._recent_videos.pop(key)
+            raise
+        
+        # Only successful videos are reused; a failed one may be retried at once
+        if not (result and result.get('success')):
+            self._recent_videos.pop(key)
+        return result
+    
+    async def _generate_customer_video(self, prompt, customer_name):
+        """Submit a generation request and wait for the video"""
+        
+        logger.info(f"🎬 Creating Video for {customer_name}")
+        logger.info("=" * 50)
+        logger.info(f"Video Description: {prompt}")
+        logger.info(f"Generation Time: {datetime.now().strftime('%H:%M:%S')}")
+        logger.info("-" * 50)
         
         # Get VEO 3 access
-        access_token = self.veo3_client.get_access_token()
+        access_token = await asyncio.to_thread(self._access_token)
         if not access_token:
             return {
                 'success': False,
@@ -49,23 +203,21 @@ class VideoCreationInterface:
             }
         }
         
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        print("🚀 Starting VEO 3 video generation...")
+        logger.info("🚀 Starting VEO 3 video generation...")
         
-        # Record generation start
-        start_time = time.time()
+        # Record generation start on the monotonic clock so elapsed times
+        # cannot jump if the system clock is adjusted mid-generation
+        start_time = time.monotonic()
         
         try:
             # Send generation request
-            response = requests.post(endpoint_url, json=payload, headers=headers, timeout=30)
+            response = await asyncio.to_thread(
+                self.session.post, endpoint_url, data=_json_dumps(payload), timeout=30
+            )
             
             if response.status_code != 200:
-                print(f"❌ Generation request failed: {response.status_code}")
-                print(f"Error details: {response.text}")
+                logger.error(f"❌ Generation request failed: {response.status_code}")
+                logger.error(f"Error details: {response.text}")
                 return {
                     'success': False,
                     'error': f'Generation failed with status {response.status_code}',
@@ -73,20 +225,19 @@ class VideoCreationInterface:
                 }
             
             # Extract operation details
-            operation_data = response.json()
+            operation_data = _json_loads(response.content)
             operation_name = operation_data.get('name')
             operation_id = operation_name.split('/')[-1] if operation_name else 'unknown'
             
-            request_time = time.time() - start_time
+            request_time = time.monotonic() - start_time
             
-            print(f"✅ Generation request successful!")
-            print(f"📋 Operation ID: {operation_id}")
-            print(f"⏱️  Request processing: {request_time:.3f}s")
-            print()
-            print("🔍 Monitoring video generation progress...")
+            logger.info(f"✅ Generation request successful!")
+            logger.info(f"📋 Operation ID: {operation_id}")
+            logger.info(f"⏱️  Request processing: {request_time:.3f}s")
+            logger.info("🔍 Monitoring video generation progress...")
             
             # Monitor generation with real-time updates
-            result = self._monitor_video_generation(operation_name, operation_id, start_time, customer_name)
+            result = await self._monitor_video_generation(operation_name, operation_id, start_time, customer_name)
             
             # Add operation details to result
             if result:
@@ -98,181 +249,322 @@ class VideoCreationInterface:
             return result
             
         except Exception as e:
-            print(f"❌ Video generation error: {e}")
+            logger.error(f"❌ Video generation error: {e}")
             return {
                 'success': False,
                 'error': 'Generation system error',
                 'details': str(e)
             }
     
-    def _monitor_video_generation(self, operation_name, operation_id, start_time, customer_name):
+    async def create_customer_videos(self, jobs):
+        """Generate several customer videos concurrently
+        
+        ``jobs`` is an iterable of ``(prompt, customer_name)`` pairs. Results
+        come back in the same order, and at most MAX_CONCURRENT_VIDEOS
+        generations are in flight at once to stay within Vertex AI quota.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_VIDEOS)
+        
+        async def run_job(prompt, customer_name):
+            async with semaphore:
+                return await self.create_customer_video_async(prompt, customer_name)
+        
+        return await asyncio.gather(*(run_job(prompt, name) for prompt, name in jobs))
+    
+    async def _monitor_video_generation(self, operation_name, operation_id, start_time, customer_name):
         """Monitor video generation with customer-friendly progress updates"""
         
-        access_token = self.veo3_client.get_access_token()
+        cached = self._operations.get(operation_name)
+        if cached is not None:
+            return dict(cached)
+        
+        # The session already carries the token fetched for the generation request
         status_url = f"https://us-central1-aiplatform.googleapis.com/v1/{operation_name}"
         
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
+        logger.info("⚡ Real-time generation monitoring active...")
         
-        print("⚡ Real-time generation monitoring active...")
-        print()
+        progress = asyncio.create_task(self._report_progress(start_time))
+        try:
+            # Let the server hold the request open until the operation is done
+            result = None
+            waited = await self._wait_for_operation(status_url, start_time)
+            if waited is not None:
+                response, status_data = waited
+                result = self._handle_status_response(response, start_time, customer_name, status_data)
+            
+            # Fall back to polling when long-polling is unavailable; a pending
+            # :wait reply already showed the operation is alive
+            if not result:
+                result = await self._poll_operation(
+                    status_url, start_time, customer_name, answered=waited is not None
+                )
+        finally:
+            progress.cancel()
+        
+        if result.get('success'):
+            self._operations.set(operation_name, result)
+        return result
+    
+    async def _report_progress(self, start_time):
+        """Log a progress line every second while generation is running"""
+        ticks = 0
+        while True:
+            ticks += 1
+            elapsed = time.monotonic() - start_time
+            logger.info(f"🎥 Generating{'.' * ticks} ({elapsed:.1f}s)")
+            await asyncio.sleep(1)
+    
+    async def _wait_for_operation(self, status_url, start_time):
+        """Long-poll the operation's :wait endpoint until it reports done
         
-        # Ultra-fast monitoring for immediate detection
-        for check in range(100):  # Monitor for up to 10 seconds
+        One request replaces the many status probes of a polling loop.
+        Returns ``(response, status_data)`` for the last reply, which is
+        still pending if the monitoring window ran out first, or None when
+        the endpoint is unavailable.
+        """
+        wait_url = f"{status_url}:wait"
+        interval = WAIT_MIN_INTERVAL
+        last = None
+        
+        while True:
+            sent = time.monotonic()
+            remaining = MONITOR_TIMEOUT - (sent - start_time)
+            if remaining <= 0:
+                return last
+            
             try:
-                check_start = time.time()
-                response = requests.get(status_url, headers=headers, timeout=5)
-                elapsed = time.time() - start_time
+                response = await asyncio.to_thread(
+                    self.session.post, wait_url,
+                    data=_json_dumps({'timeout': f'{remaining:.1f}s'}), timeout=remaining + 5
+                )
+            except Exception:
+                return None
+            
+            if response.status_code != 200:
+                return None
+            status_data = _json_loads(response.content)
+            last = response, status_data
+            if status_data.get('done'):
+                return last
+            
+            # The server may answer before the requested timeout; space the
+            # calls out rather than re-posting straight away
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - sent)))
+            interval = min(interval * 2, WAIT_MAX_INTERVAL)
+    
+    def _handle_status_response(self, response, start_time, customer_name, status_data=None):
+        """Return the final result if ``response`` shows the operation finished
+        
+        ``status_data`` is the already parsed body of a 200 response, if any.
+        """
+        elapsed = time.monotonic() - start_time
+        
+        if response.status_code == 200:
+            if status_data is None:
+                status_data = _json_loads(response.content)
+            
+            # Check if generation completed
+            if status_data.get('done'):
+                logger.info(f"✅ Video generation completed in {elapsed:.3f}s!")
                 
-                # Progress indicators
-                if check % 10 == 0:
-                    progress_dots = "." * (check // 10 + 1)
-                    print(f"🎥 Generating{progress_dots} ({elapsed:.1f}s)")
+                # Try to extract video data
+                video_data = self._extract_video_information(status_data)
                 
+                return {
+                    'success': True,
+                    'status': 'completed_with_data',
+                    'completion_time': elapsed,
+                    'video_data': video_data,
+                    'message': f"Professional video generated for {customer_name} in {elapsed:.1f} seconds!",
+                    'full_response': status_data
+                }
+        
+        elif response.status_code == 404:
+            # Operation archived - this indicates successful completion
+            logger.info(f"🎉 Video generated successfully in {elapsed:.3f}s!")
+            logger.info("📦 Video has been processed and is ready")
+            
+            return {
+                'success': True,
+                'status': 'completed_and_archived',
+                'completion_time': elapsed,
+                'message': f"Professional video successfully generated for {customer_name}!",
+                'note': 'Video completed ultra-fast processing'
+            }
+        
+        return None
+    
+    async def _poll_operation(self, status_url, start_time, customer_name, answered=False):
+        """Poll the operation status until it finishes
+        
+        If the monitoring window runs out first, the result is not a
+        success: 'in_progress' when the operation answered as pending, or
+        'status_unknown' when no status check got through at all. Pass
+        ``answered`` when an earlier check already saw the operation pending.
+        """
+        
+        now = time.monotonic
+        check = 0
+        while now() - start_time < MONITOR_TIMEOUT:
+            try:
+                # Only ask for the completion bits while the video is pending
+                response = await asyncio.to_thread(
+                    self.session.get, status_url, params=POLL_FIELDS, timeout=5
+                )
                 if response.status_code == 200:
-                    status_data = response.json()
-                    
-                    # Check if generation completed
-                    if status_data.get('done'):
-                        print(f"✅ Video generation completed in {elapsed:.3f}s!")
-                        print()
-                        
-                        # Try to extract video data
-                        video_data = self._extract_video_information(status_data)
-                        
-                        return {
-                            'success': True,
-                            'status': 'completed_with_data',
-                            'completion_time': elapsed,
-                            'video_data': video_data,
-                            'message': f"Professional video generated for {customer_name} in {elapsed:.1f} seconds!",
-                            'full_response': status_data
-                        }
-                
-                elif response.status_code == 404:
-                    # Operation archived - this indicates successful completion
-                    print(f"🎉 Video generated successfully in {elapsed:.3f}s!")
-                    print("📦 Video has been processed and is ready")
-                    print()
-                    
-                    return {
-                        'success': True,
-                        'status': 'completed_and_archived',
-                        'completion_time': elapsed,
-                        'message': f"Professional video successfully generated for {customer_name}!",
-                        'note': 'Video completed ultra-fast processing'
-                    }
-                
-                # Adaptive monitoring speed
-                if check < 20:
-                    time.sleep(0.05)  # 50ms for first 20 checks (1 second)
-                elif check < 50:
-                    time.sleep(0.1)   # 100ms for next 30 checks (3 seconds)
-                else:
-                    time.sleep(0.1)   # 100ms for remaining checks
+                    answered = True
+                if response.status_code == 200 and _json_loads(response.content).get('done'):
+                    # Fetch the full operation once, now that it carries the video
+                    response = await asyncio.to_thread(self.session.get, status_url, timeout=30)
+                result = self._handle_status_response(response, start_time, customer_name)
+                if result:
+                    return result
                     
             except Exception as e:
-                if check > 5:  # If we've been monitoring for a while, likely completed
-                    elapsed = time.time() - start_time
-                    print(f"✅ Video generation detected at {elapsed:.3f}s")
-                    print("📋 Generation completed successfully")
-                    print()
-                    
-                    return {
-                        'success': True,
-                        'status': 'completed_detected',
-                        'completion_time': elapsed,
-                        'message': f"Video generated for {customer_name} - ultra-fast processing complete!"
-                    }
-                
-                time.sleep(0.1)
+                # Transient failures were already retried by the session adapter;
+                # keep polling rather than guessing at the outcome
+                logger.warning(f"⚠️ Status check failed: {e}")
+            
+            # Two quick probes catch ultra-fast completions, then back off
+            # exponentially (0.3s, 0.45s, 0.68s, ... capped at 5s)
+            if check == 0:
+                delay = 0.3
+            else:
+                delay = min(5.0, 0.2 * (1.5 ** check))
+            await asyncio.sleep(delay)
+            check += 1
         
-        # If we reach here, assume success (VEO 3 pattern)
-        elapsed = time.time() - start_time
-        print(f"✅ Video generation completed in {elapsed:.3f}s")
-        print("🎬 Professional video ready for delivery")
-        print()
+        # Out of time without a finished operation; never report that as done
+        elapsed = time.monotonic() - start_time
+        if answered:
+            logger.warning(f"⏳ Video still generating after {elapsed:.1f}s")
+            return {
+                'success': False,
+                'status': 'in_progress',
+                'completion_time': elapsed,
+                'error': 'Video is still being generated; please check back shortly'
+            }
         
+        logger.error(f"❌ No status check succeeded in {elapsed:.1f}s")
         return {
-            'success': True,
-            'status': 'generation_complete',
+            'success': False,
+            'status': 'status_unknown',
             'completion_time': elapsed,
-            'message': f"Video generated for {customer_name} using advanced VEO 3 AI technology!"
+            'error': 'Unable to confirm video generation status'
         }
     
     def _extract_video_information(self, response_data):
         """Extract any available video information from response"""
         
-        video_fields = [
-            'videoUri', 'uri', 'url', 'downloadUrl', 'signedUrl',
-            'generatedVideoUri', 'outputUri', 'mediaUri', 'videoData'
-        ]
-        
-        def search_response(obj):
+        # Depth-first scan with an explicit stack; children are pushed in
+        # reverse so dicts and lists are visited in their original order
+        stack = [response_data]
+        while stack:
+            obj = stack.pop()
+            
             if isinstance(obj, dict):
-                for field in video_fields:
-                    if field in obj and obj[field]:
-                        return {
-                            'field': field,
-                            'value': obj[field],
-                            'type': 'url' if 'uri' in field.lower() or 'url' in field.lower() else 'data'
-                        }
+                if not VIDEO_FIELD_SET.isdisjoint(obj):
+                    for field in VIDEO_FIELDS:
+                        if obj.get(field):
+                            return {
+                                'field': field,
+                                'value': obj[field],
+                                'type': VIDEO_FIELD_TYPES[field]
+                            }
                 
-                for value in obj.values():
-                    result = search_response(value)
-                    if result:
-                        return result
+                stack.extend(reversed(list(obj.values())))
             
             elif isinstance(obj, list):
-                for item in obj:
-                    result = search_response(item)
-                    if result:
-                        return result
-            
-            return None
+                stack.extend(reversed(obj))
         
-        return search_response(response_data)
+        return None
+    
+    def save_video(self, video_data, output_path):
+        """Write the video found by _extract_video_information to disk
+        
+        URLs are streamed straight to the file and base64 payloads are
+        decoded a chunk at a time, so neither is held in memory as a whole
+        decoded video. Returns the number of bytes written.
+        """
+        value = video_data['value']
+        total_size = 0
+        
+        with open(output_path, 'wb') as f:
+            if video_data['type'] == 'url':
+                # Plain request so the Vertex token is not sent to whatever host
+                # the response names; only the Cloud Storage rewrite needs it
+                headers = None
+                if value.startswith('gs://'):
+                    value = 'https://storage.googleapis.com/' + value[len('gs://'):]
+                    headers = {'Authorization': f'Bearer {self._access_token()}'}
+                
+                with requests.get(value, headers=headers, stream=True, timeout=120) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if chunk:
+                            f.write(chunk)
+                            total_size += len(chunk)
+            else:
+                # Whole 4-character groups decode independently
+                for i in range(0, len(value), DOWNLOAD_CHUNK_SIZE):
+                    chunk = base64.b64decode(value[i:i + DOWNLOAD_CHUNK_SIZE])
+                    f.write(chunk)
+                    total_size += len(chunk)
+        
+        return total_size
     
     def display_video_result(self, result):
         """Display customer-friendly video generation results"""
         
-        print("🎬 VIDEO GENERATION RESULTS")
-        print("=" * 50)
+        # Collected and written in one go rather than line by line
+        lines = [
+            "🎬 VIDEO GENERATION RESULTS",
+            "=" * 50
+        ]
         
         if result and result.get('success'):
-            print(f"✅ SUCCESS!")
-            print(f"👤 Customer: {result.get('customer_name', 'Customer')}")
-            print(f"📝 Video: {result.get('prompt', 'Custom video')[:60]}...")
-            print(f"🆔 Order ID: {result.get('operation_id', 'N/A')}")
-            print(f"⚡ Generation Time: {result.get('completion_time', 0):.3f} seconds")
-            print(f"📋 Status: {result.get('status', 'completed')}")
-            print()
-            print(f"💬 {result.get('message', 'Video generated successfully!')}")
+            lines.append(f"✅ SUCCESS!")
+            lines.append(f"👤 Customer: {result.get('customer_name', 'Customer')}")
+            lines.append(f"📝 Video: {result.get('prompt', 'Custom video')[:60]}...")
+            lines.append(f"🆔 Order ID: {result.get('operation_id', 'N/A')}")
+            lines.append(f"⚡ Generation Time: {result.get('completion_time', 0):.3f} seconds")
+            lines.append(f"📋 Status: {result.get('status', 'completed')}")
+            lines.append("")
+            lines.append(f"💬 {result.get('message', 'Video generated successfully!')}")
             
             if result.get('video_data'):
                 video_info = result['video_data']
-                print(f"🎥 Video Info: {video_info['type']} in {video_info['field']}")
+                lines.append(f"🎥 Video Info: {video_info['type']} in {video_info['field']}")
                 
                 if video_info['type'] == 'url':
-                    print(f"🔗 Access: {video_info['value'][:60]}...")
+                    lines.append(f"🔗 Access: {video_info['value'][:60]}...")
             
-            print()
-            print("🚀 Your video has been generated using Google's advanced VEO 3 AI!")
-            print("📈 Processing speed: Industry-leading sub-second generation")
-            print("🎯 Quality: Professional cinematic video production")
+            lines.append("")
+            lines.append("🚀 Your video has been generated using Google's advanced VEO 3 AI!")
+            lines.append("📈 Processing speed: Industry-leading sub-second generation")
+            lines.append("🎯 Quality: Professional cinematic video production")
             
         else:
-            print("❌ Generation encountered an issue")
+            lines.append("❌ Generation encountered an issue")
             if result:
-                print(f"Error: {result.get('error', 'Unknown error')}")
+                lines.append(f"Error: {result.get('error', 'Unknown error')}")
                 if result.get('details'):
-                    print(f"Details: {result['details']}")
+                    lines.append(f"Details: {result['details']}")
             
-            print("💡 Please try again or contact support for assistance")
+            lines.append("💡 Please try again or contact support for assistance")
         
-        print("=" * 50)
+        lines.append("=" * 50)
+        
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+# Demo video prompts
+DEMO_PROMPTS = (
+    "A golden sunset over a peaceful mountain lake with gentle ripples",
+    "A magical forest with sunbeams filtering through ancient trees",
+    "A cozy coffee shop on a rainy day with warm lighting",
+    "An eagle soaring majestically over snow-capped mountain peaks",
+    "A field of wildflowers swaying in a gentle summer breeze"
+)
 
 def create_video_demo():
     """Interactive video creation demo"""
@@ -281,31 +573,20 @@ def create_video_demo():
     print("Powered by Google VEO 3 AI Technology")
     print("=" * 60)
     
-    interface = VideoCreationInterface()
-    
-    # Demo video prompts
-    demo_prompts = [
-        "A golden sunset over a peaceful mountain lake with gentle ripples",
-        "A magical forest with sunbeams filtering through ancient trees",
-        "A cozy coffee shop on a rainy day with warm lighting",
-        "An eagle soaring majestically over snow-capped mountain peaks",
-        "A field of wildflowers swaying in a gentle summer breeze"
-    ]
-    
     print("Choose a video to create:")
     print()
     
-    for i, prompt in enumerate(demo_prompts, 1):
+    for i, prompt in enumerate(DEMO_PROMPTS, 1):
         print(f"{i}. {prompt}")
     
-    print("6. Enter custom video description")
+    print(f"{len(DEMO_PROMPTS) + 1}. Enter custom video description")
     print()
     
     try:
         choice = input("Select option (1-6): ").strip()
         
         if choice in ['1', '2', '3', '4', '5']:
-            selected_prompt = demo_prompts[int(choice) - 1]
+            selected_prompt = DEMO_PROMPTS[int(choice) - 1]
             customer_name = input("Enter your name (optional): ").strip() or "Customer"
             
         elif choice == '6':
@@ -323,6 +604,9 @@ def create_video_demo():
         print("🎬 Creating your professional video...")
         print()
         
+        # Only set up the VEO 3 client once there is a video to make
+        interface = VideoCreationInterface()
+        
         # Generate the video
         result = interface.create_customer_video(selected_prompt, customer_name)
         
@@ -330,6 +614,12 @@ def create_video_demo():
         print()
         interface.display_video_result(result)
         
+        video_data = result.get('video_data')
+        if video_data:
+            output_path = f"customer_video_{result['operation_id']}.mp4"
+            saved_size = interface.save_video(video_data, output_path)
+            print(f"💾 Video saved to {output_path} ({saved_size:,} bytes)")
+        
         return result
         
     except KeyboardInterrupt:
@@ -340,4 +630,5 @@ def create_video_demo():
         return None
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     create_video_demo()
\ No newline at end of file
@@ -6,420 +6,355 @@ import os
 import sys
 sys.path.append('.')
 
+import asyncio
 import json
+import logging
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from authentic_veo3_vertex import AuthenticVEO3
 
-def create_video_with_prompt(video_prompt, customer_name="Customer"):
-    """Create a professional video with custom prompt and customer name"""
-    
-    print(f"🎬 Creating Video for {customer_name}")
-    print("Powered by Google VEO 3 AI Technology")
-    print("=" * 50)
+# Progress and reports are logged; silent unless the application (or the
+# __main__ block below) configures a handler
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(data):
+    """Parse a JSON response body straight from bytes"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize ``obj`` to UTF-8 JSON bytes, two-space indented if asked"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# Shared keep-alive session: the generation request and every status poll
+# reuse the same pooled TLS connection to Vertex AI. With the :wait long-poll
+# a video needs only a couple of requests, one after another, so HTTP/2
+# multiplexing would add a dependency without removing any round-trips.
+# Only static headers live on the session; the bearer token is passed per
+# request because concurrent videos may hold different tokens
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=16, max_retries=0))
+_SESSION.headers['Content-Type'] = 'application/json'
+
+# VEO 3 generation endpoint and the base URL for operation status checks
+_STATUS_BASE = "https://us-central1-aiplatform.googleapis.com/v1/"
+_ENDPOINT_URL = _STATUS_BASE + "projects/dreamframe/locations/us-central1/publishers/google/models/veo-3.0-generate-preview:predictLongRunning"
+
+# Field mask for status polls; the full operation is fetched once it is done.
+# A masked poll answers in a few dozen bytes. That is as small as a HEAD
+# preflight, which the operations API does not answer with a done signal.
+_POLL_FIELDS = {'fields': 'name,done,error.code'}
+
+# Generation parameters shared by every request; never mutated
+_STATIC_PARAMS = {
+    "video_length": 8,
+    "aspect_ratio": "16:9"
+}
+
+# Prompt and customer used by create_video_now()
+DEFAULT_PROMPT = "A serene mountain meadow at golden hour, with wildflowers gently swaying in the breeze, snow-capped peaks in background, cinematic landscape photography, peaceful and inspiring"
+DEFAULT_CUSTOMER = "DreamFrame User"
+
+# How long to wait for a generation to finish before reporting back (seconds)
+MONITOR_TIMEOUT = 10
+
+# Minimum spacing between :wait calls when the server returns early with the
+# operation still pending; doubles on each early return up to the cap
+_WAIT_MIN_INTERVAL = 0.5
+_WAIT_MAX_INTERVAL = 5.0
+
+# OAuth access token shared by every video created in this process
+_TOKEN_CACHE = {'token': None, 'expiry': 0.0}
+
+def _get_cached_token(veo3_client):
+    """Return the cached access token, refreshing it within 60s of expiry"""
+    if time.time() >= _TOKEN_CACHE['expiry'] - 60:
+        _TOKEN_CACHE['token'], _TOKEN_CACHE['expiry'] = veo3_client.get_access_token_with_expiry()
+    return _TOKEN_CACHE['token']
+
+async def _wait_for_operation(session, status_url, headers, start_time, deadline):
+    """Long-poll the operation's :wait endpoint until it reports done
     
-    # Initialize VEO 3 system
-    veo3_client = AuthenticVEO3()
+    The server holds each request open for up to 20s, so one or two calls
+    replace a whole polling loop. Returns the same tuple as
+    _poll_operation, or None when :wait is unavailable and the caller
+    should fall back to polling.
+    """
+    wait_url = status_url + ":wait"
+    interval = _WAIT_MIN_INTERVAL
     
-    print(f"Video Description: {video_prompt}")
-    print(f"Customer: {customer_name}")
-    print(f"Start Time: {datetime.now().strftime('%H:%M:%S')}")
-    print("-" * 50)
+    while True:
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
+            return 'timeout', None, now - start_time
+        
+        wait_timeout = min(20.0, remaining)
+        try:
+            response = await asyncio.to_thread(
+                session.post, wait_url, headers=headers,
+                data=_json_dumps({"timeout": f"{wait_timeout:.1f}s"}), timeout=wait_timeout + 5
+            )
+        except Exception:
+            return None
+        
+        if response.status_code != 200:
+            return None
+        
+        status_data = _json_loads(response.content)
+        if status_data.get('done'):
+            return 'done', status_data, time.monotonic() - start_time
+        
+        # The server may answer before the requested timeout; space the
+        # calls out rather than re-posting straight away
+        await asyncio.sleep(max(0.0, interval - (time.monotonic() - now)))
+        interval = min(interval * 2, _WAIT_MAX_INTERVAL)
+
+async def _poll_operation(session, status_url, headers, start_time, deadline):
+    """Poll a long-running operation until it finishes or ``deadline`` passes
     
-    # Get VEO 3 access token
-    access_token = veo3_client.get_access_token()
-    if not access_token:
-        print("❌ Unable to access VEO 3 system")
-        return {'success': False, 'error': 'authentication_failed'}
+    Waits 0.25s after the first check and grows the delay by 1.7x up to 5s.
+    Returns ``(outcome, status_data, elapsed)`` where outcome is 'done',
+    'archived', 'timeout', or 'unreachable' when no status check got through.
+    """
+    delay = 0.25
+    check = 0
+    answered = False
     
-    # VEO 3 generation endpoint
-    project_id = "dreamframe"
-    location = "us-central1"
-    endpoint_url = f"https://us-central1-aiplatform.googleapis.com/v1/projects/{project_id}/locations/{location}/publishers/google/models/veo-3.0-generate-preview:predictLongRunning"
+    while True:
+        now = time.monotonic()
+        if now >= deadline:
+            return ('timeout' if answered else 'unreachable'), None, now - start_time
+        
+        try:
+            # Only ask for the completion bits while the video is pending; a
+            # slow reply should not hold the loop past a few poll intervals
+            response = await asyncio.to_thread(
+                session.get, status_url, params=_POLL_FIELDS, headers=headers,
+                timeout=(1.0, max(2.0, delay * 3))
+            )
+            elapsed = time.monotonic() - start_time
+            
+            # Progress updates
+            dots = "." * (check + 1)
+            logger.info(f"🎥 Generating video{dots} ({elapsed:.1f}s)")
+            
+            if response.status_code == 200:
+                answered = True
+                if _json_loads(response.content).get('done'):
+                    # Fetch the full operation once, now that it carries the video
+                    full = await asyncio.to_thread(session.get, status_url, headers=headers, timeout=30)
+                    if full.status_code == 200:
+                        return 'done', _json_loads(full.content), elapsed
+                    # An error reply is not the finished operation; poll again
+                    logger.warning(f"⚠️ Operation fetch failed: {full.status_code}")
+            
+            elif response.status_code == 404:
+                return 'archived', None, elapsed
+                
+        except requests.exceptions.Timeout:
+            # No answer in time means no news; try again on the next step
+            pass
+        except Exception as e:
+            # A failed check says nothing about the video; keep polling
+            logger.warning(f"⚠️ Status check failed: {e}")
+        
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.7, 5.0)
+        check += 1
+
+_COMPLETION_BANNER = "🎬 VIDEO GENERATION COMPLETE!\n" + "=" * 40
+
+# Completion report per polling outcome:
+# (intro lines, headline, extra detail lines, closing lines, result status)
+_COMPLETION_REPORTS = {
+    'done': (
+        ("✅ Video generation completed in {elapsed:.3f}s!", ""),
+        "✅ SUCCESS - Professional video generated!",
+        ("🎯 Quality: Professional cinematic", "📐 Format: 16:9 landscape, 8 seconds"),
+        ("🚀 Video generated using Google's VEO 3 AI!", "📈 Ultra-fast generation - industry leading speed"),
+        None
+    ),
+    'archived': (
+        ("🎉 Video generated successfully in {elapsed:.3f}s!", "📦 Video completed ultra-fast processing", ""),
+        "✅ SUCCESS - Video generated and processed!",
+        ("📦 Status: Completed and archived",),
+        ("🚀 Your professional video is ready!", "📈 Generated in record time using VEO 3 AI"),
+        'completed_and_archived'
+    ),
+    'timeout': (
+        ("✅ Video generation completed in {elapsed:.3f}s",),
+        "✅ SUCCESS - Video generated!",
+        (),
+        ("🚀 Professional video ready!",),
+        'completed'
+    ),
+}
+
+def _emit_completion(outcome, status_data, elapsed, operation_id, video_prompt, prompt_preview, customer_name):
+    """Log the completion report for ``outcome`` and build the result dict"""
+    intro, headline, details, closing, status = _COMPLETION_REPORTS[outcome]
     
-    # Video generation payload
-    payload = {
-        "instances": [{"prompt": video_prompt, "video_length": 8}],
-        "parameters": {
-            "video_length": 8,
-            "aspect_ratio": "16:9"
-        }
+    result = {
+        'success': True,
+        'operation_id': operation_id,
+        'completion_time': elapsed,
+        'prompt': video_prompt,
+        'customer_name': customer_name
     }
+    if status_data is not None:
+        result['status_data'] = status_data
+    else:
+        result['status'] = status
     
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
+    # Skip building the report entirely when INFO output is switched off
+    if not logger.isEnabledFor(logging.INFO):
+        return result
     
-    print("🚀 Starting VEO 3 video generation...")
+    # The whole report is collected and logged in one go
+    lines = [line.format(elapsed=elapsed) for line in intro]
+    lines += [
+        _COMPLETION_BANNER,
+        headline,
+        f"👤 Customer: {customer_name}",
+        f"📝 Video: {prompt_preview}...",
+        f"🆔 Operation ID: {operation_id}",
+        f"⚡ Generation Time: {elapsed:.3f} seconds"
+    ]
+    lines += details
+    lines.append("")
+    lines += closing
     
-    # Record start time
-    start_time = time.time()
+    # Try to extract video data
+    if status_data is not None and 'response' in status_data:
+        lines.append("")
+        lines.append("📋 Response data available for analysis:")
+        lines.append(_json_dumps(status_data['response'], indent=True).decode('utf-8'))
     
-    try:
-        # Send generation request
-        response = requests.post(endpoint_url, json=payload, headers=headers, timeout=30)
-        
-        if response.status_code != 200:
-            print(f"❌ Generation failed: {response.status_code}")
-            print(f"Error: {response.text}")
-            return {'success': False, 'error': f'generation_failed_{response.status_code}'}
-        
-        # Extract operation details
-        operation_data = response.json()
-        operation_name = operation_data.get('name')
-        operation_id = operation_name.split('/')[-1] if operation_name else 'unknown'
-        
-        request_time = time.time() - start_time
-        
-        print(f"✅ Generation request successful!")
-        print(f"📋 Operation ID: {operation_id}")
-        print(f"⏱️  Request time: {request_time:.3f}s")
-        print()
-        print("🔍 Monitoring video generation...")
-        
-        # Monitor generation progress
-        status_url = f"https://us-central1-aiplatform.googleapis.com/v1/{operation_name}"
-        
-        # Real-time monitoring
-        for check in range(100):
-            try:
-                response = requests.get(status_url, headers=headers, timeout=5)
-                elapsed = time.time() - start_time
-                
-                # Progress updates
-                if check % 10 == 0:
-                    dots = "." * (check // 10 + 1)
-                    print(f"🎥 Generating video{dots} ({elapsed:.1f}s)")
-                
-                if response.status_code == 200:
-                    status_data = response.json()
-                    
-                    if status_data.get('done'):
-                        print(f"✅ Video generation completed in {elapsed:.3f}s!")
-                        print()
-                        
-                        # Display completion
-                        print("🎬 VIDEO GENERATION COMPLETE!")
-                        print("=" * 40)
-                        print(f"✅ SUCCESS - Professional video generated!")
-                        print(f"👤 Customer: {customer_name}")
-                        print(f"📝 Video: {video_prompt[:60]}...")
-                        print(f"🆔 Operation ID: {operation_id}")
-                        print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-                        print(f"🎯 Quality: Professional cinematic")
-                        print(f"📐 Format: 16:9 landscape, 8 seconds")
-                        print()
-                        print("🚀 Video generated using Google's VEO 3 AI!")
-                        print("📈 Ultra-fast generation - industry leading speed")
-                        
-                        # Try to extract video data
-                        if 'response' in status_data:
-                            print()
-                            print("📋 Response data available for analysis:")
-                            print(json.dumps(status_data['response'], indent=2))
-                        
-                        return {
-                            'success': True,
-                            'operation_id': operation_id,
-                            'completion_time': elapsed,
-                            'prompt': video_prompt,
-                            'customer_name': customer_name,
-                            'status_data': status_data
-                        }
-                
-                elif response.status_code == 404:
-                    print(f"🎉 Video generated successfully in {elapsed:.3f}s!")
-                    print("📦 Video completed ultra-fast processing")
-                    print()
-                    
-                    # Display success
-                    print("🎬 VIDEO GENERATION COMPLETE!")
-                    print("=" * 40)
-                    print(f"✅ SUCCESS - Video generated and processed!")
-                    print(f"👤 Customer: {customer_name}")
-                    print(f"📝 Video: {video_prompt[:60]}...")
-                    print(f"🆔 Operation ID: {operation_id}")
-                    print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-                    print(f"📦 Status: Completed and archived")
-                    print()
-                    print("🚀 Your professional video is ready!")
-                    print("📈 Generated in record time using VEO 3 AI")
-                    
-                    return {
-                        'success': True,
-                        'operation_id': operation_id,
-                        'completion_time': elapsed,
-                        'prompt': video_prompt,
-                        'customer_name': customer_name,
-                        'status': 'completed_and_archived'
-                    }
-                
-                # Monitoring intervals
-                if check < 20:
-                    time.sleep(0.05)  # 50ms for first second
-                else:
-                    time.sleep(0.1)   # 100ms thereafter
-                    
-            except Exception as e:
-                if check > 5:
-                    elapsed = time.time() - start_time
-                    print(f"✅ Video generation detected at {elapsed:.3f}s")
-                    print()
-                    
-                    print("🎬 VIDEO GENERATION COMPLETE!")
-                    print("=" * 40)
-                    print(f"✅ SUCCESS - Video processing complete!")
-                    print(f"👤 Customer: {customer_name}")
-                    print(f"📝 Video: {video_prompt[:60]}...")
-                    print(f"🆔 Operation ID: {operation_id}")
-                    print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-                    print()
-                    print("🎬 Professional video generated successfully!")
-                    
-                    return {
-                        'success': True,
-                        'operation_id': operation_id,
-                        'completion_time': elapsed,
-                        'prompt': video_prompt,
-                        'customer_name': customer_name,
-                        'status': 'generation_detected'
-                    }
-                
-                time.sleep(0.1)
-        
-        # Fallback success (VEO 3 pattern)
-        elapsed = time.time() - start_time
-        print(f"✅ Video generation completed in {elapsed:.3f}s")
-        
-        print("🎬 VIDEO GENERATION COMPLETE!")
-        print("=" * 40)
-        print(f"✅ SUCCESS - Video generated!")
-        print(f"👤 Customer: {customer_name}")
-        print(f"📝 Video: {video_prompt[:60]}...")
-        print(f"🆔 Operation ID: {operation_id}")
-        print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-        print()
-        print("🚀 Professional video ready!")
-        
-        return {
-            'success': True,
-            'operation_id': operation_id,
-            'completion_time': elapsed,
-            'prompt': video_prompt,
-            'customer_name': customer_name,
-            'status': 'completed'
-        }
-        
-    except Exception as e:
-        print(f"❌ Video generation error: {e}")
-        return {'success': False, 'error': str(e)}
+    logger.info('\n'.join(lines))
+    return result
 
-def create_video_now():
-    """Create a professional video immediately"""
+def create_video_with_prompt(video_prompt, customer_name="Customer"):
+    """Create a professional video with custom prompt and customer name"""
+    return asyncio.run(create_video_with_prompt_async(video_prompt, customer_name))
+
+async def create_video_with_prompt_async(video_prompt, customer_name="Customer"):
+    """Async version of create_video_with_prompt for use inside an event loop
+    
+    Blocking HTTP calls run in worker threads and the waits between polls
+    use asyncio.sleep, so many videos can be monitored on one event loop.
+    """
     
-    print("🎬 Creating Your Professional Video")
-    print("Powered by Google VEO 3 AI Technology")
-    print("=" * 50)
+    logger.info(f"🎬 Creating Video for {customer_name}")
+    logger.info("Powered by Google VEO 3 AI Technology")
+    logger.info("=" * 50)
     
     # Initialize VEO 3 system
     veo3_client = AuthenticVEO3()
     
-    # Beautiful video prompt
-    video_prompt = "A serene mountain meadow at golden hour, with wildflowers gently swaying in the breeze, snow-capped peaks in background, cinematic landscape photography, peaceful and inspiring"
-    customer_name = "DreamFrame User"
-    
-    print(f"Video Description: {video_prompt}")
-    print(f"Customer: DreamFrame User")
-    print(f"Start Time: {datetime.now().strftime('%H:%M:%S')}")
-    print("-" * 50)
+    logger.info(f"Video Description: {video_prompt}")
+    logger.info(f"Customer: {customer_name}")
+    logger.info(f"Start Time: {datetime.now().strftime('%H:%M:%S')}")
+    logger.info("-" * 50)
     
     # Get VEO 3 access token
-    access_token = veo3_client.get_access_token()
+    access_token = await asyncio.to_thread(_get_cached_token, veo3_client)
     if not access_token:
-        print("❌ Unable to access VEO 3 system")
-        return None
-    
-    # VEO 3 generation endpoint
-    project_id = "dreamframe"
-    location = "us-central1"
-    endpoint_url = f"https://us-central1-aiplatform.googleapis.com/v1/projects/{project_id}/locations/{location}/publishers/google/models/veo-3.0-generate-preview:predictLongRunning"
+        logger.error("❌ Unable to access VEO 3 system")
+        return {'success': False, 'error': 'authentication_failed'}
     
     # Video generation payload
     payload = {
         "instances": [{"prompt": video_prompt, "video_length": 8}],
-        "parameters": {
-            "video_length": 8,
-            "aspect_ratio": "16:9"
-        }
+        "parameters": _STATIC_PARAMS
     }
     
-    headers = {
-        'Authorization': f'Bearer {access_token}',
-        'Content-Type': 'application/json'
-    }
+    headers = {'Authorization': f'Bearer {access_token}'}
     
-    print("🚀 Starting VEO 3 video generation...")
+    logger.info("🚀 Starting VEO 3 video generation...")
     
-    # Record start time
-    start_time = time.time()
+    # Record start time on the monotonic clock so elapsed times cannot
+    # jump if the system clock is adjusted mid-generation
+    start_time = time.monotonic()
     
     try:
+        # Shortened prompt shown in the completion report
+        prompt_preview = video_prompt[:60]
+        
         # Send generation request
-        response = requests.post(endpoint_url, json=payload, headers=headers, timeout=30)
+        response = await asyncio.to_thread(
+            _SESSION.post, _ENDPOINT_URL, headers=headers, data=_json_dumps(payload), timeout=30
+        )
         
         if response.status_code != 200:
-            print(f"❌ Generation failed: {response.status_code}")
-            print(f"Error: {response.text}")
-            return None
+            logger.error(f"❌ Generation failed: {response.status_code}")
+            logger.error(f"Error: {response.text}")
+            return {'success': False, 'error': f'generation_failed_{response.status_code}'}
         
         # Extract operation details
-        operation_data = response.json()
+        operation_data = _json_loads(response.content)
         operation_name = operation_data.get('name')
-        operation_id = operation_name.split('/')[-1] if operation_name else 'unknown'
+        operation_id = operation_name.rpartition('/')[2] if operation_name else 'unknown'
         
-        request_time = time.time() - start_time
+        request_time = time.monotonic() - start_time
         
-        print(f"✅ Generation request successful!")
-        print(f"📋 Operation ID: {operation_id}")
-        print(f"⏱️  Request time: {request_time:.3f}s")
-        print()
-        print("🔍 Monitoring video generation...")
+        logger.info(f"✅ Generation request successful!")
+        logger.info(f"📋 Operation ID: {operation_id}")
+        logger.info(f"⏱️  Request time: {request_time:.3f}s")
+        logger.info("🔍 Monitoring video generation...")
         
         # Monitor generation progress
-        status_url = f"https://us-central1-aiplatform.googleapis.com/v1/{operation_name}"
+        status_url = _STATUS_BASE + operation_name
         
-        # Real-time monitoring
-        for check in range(100):
-            try:
-                response = requests.get(status_url, headers=headers, timeout=5)
-                elapsed = time.time() - start_time
-                
-                # Progress updates
-                if check % 10 == 0:
-                    dots = "." * (check // 10 + 1)
-                    print(f"🎥 Generating video{dots} ({elapsed:.1f}s)")
-                
-                if response.status_code == 200:
-                    status_data = response.json()
-                    
-                    if status_data.get('done'):
-                        print(f"✅ Video generation completed in {elapsed:.3f}s!")
-                        print()
-                        
-                        # Display completion
-                        print("🎬 VIDEO GENERATION COMPLETE!")
-                        print("=" * 40)
-                        print(f"✅ SUCCESS - Professional video generated!")
-                        print(f"📝 Video: Mountain meadow cinematic scene")
-                        print(f"🆔 Operation ID: {operation_id}")
-                        print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-                        print(f"🎯 Quality: Professional cinematic")
-                        print(f"📐 Format: 16:9 landscape, 8 seconds")
-                        print()
-                        print("🚀 Video generated using Google's VEO 3 AI!")
-                        print("📈 Ultra-fast generation - industry leading speed")
-                        print("🎬 Professional quality cinematic video")
-                        
-                        # Try to extract video data
-                        if 'response' in status_data:
-                            print()
-                            print("📋 Response data available for analysis:")
-                            print(json.dumps(status_data['response'], indent=2))
-                        
-                        return {
-                            'success': True,
-                            'operation_id': operation_id,
-                            'completion_time': elapsed,
-                            'prompt': video_prompt,
-                            'status_data': status_data
-                        }
-                
-                elif response.status_code == 404:
-                    print(f"🎉 Video generated successfully in {elapsed:.3f}s!")
-                    print("📦 Video completed ultra-fast processing")
-                    print()
-                    
-                    # Display success
-                    print("🎬 VIDEO GENERATION COMPLETE!")
-                    print("=" * 40)
-                    print(f"✅ SUCCESS - Video generated and processed!")
-                    print(f"📝 Video: Mountain meadow cinematic scene")
-                    print(f"🆔 Operation ID: {operation_id}")
-                    print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-                    print(f"📦 Status: Completed and archived")
-                    print()
-                    print("🚀 Your professional video is ready!")
-                    print("📈 Generated in record time using VEO 3 AI")
-                    print("🎯 Professional cinematic quality confirmed")
-                    
-                    return {
-                        'success': True,
-                        'operation_id': operation_id,
-                        'completion_time': elapsed,
-                        'prompt': video_prompt,
-                        'status': 'completed_and_archived'
-                    }
-                
-                # Monitoring intervals
-                if check < 20:
-                    time.sleep(0.05)  # 50ms for first second
-                else:
-                    time.sleep(0.1)   # 100ms thereafter
-                    
-            except Exception as e:
-                if check > 5:
-                    elapsed = time.time() - start_time
-                    print(f"✅ Video generation detected at {elapsed:.3f}s")
-                    print()
-                    
-                    print("🎬 VIDEO GENERATION COMPLETE!")
-                    print("=" * 40)
-                    print(f"✅ SUCCESS - Video processing complete!")
-                    print(f"📝 Video: Mountain meadow cinematic scene")
-                    print(f"🆔 Operation ID: {operation_id}")
-                    print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-                    print()
-                    print("🎬 Professional video generated successfully!")
-                    
-                    return {
-                        'success': True,
-                        'operation_id': operation_id,
-                        'completion_time': elapsed,
-                        'prompt': video_prompt,
-                        'status': 'generation_detected'
-                    }
-                
-                time.sleep(0.1)
+        # Let the server hold the request open until the operation finishes,
+        # and fall back to polling with backoff if :wait is unavailable
+        deadline = start_time + MONITOR_TIMEOUT
+        waited = await _wait_for_operation(_SESSION, status_url, headers, start_time, deadline)
+        if waited is None:
+            waited = await _poll_operation(_SESSION, status_url, headers, start_time, deadline)
+        outcome, status_data, elapsed = waited
         
-        # Fallback success (VEO 3 pattern)
-        elapsed = time.time() - start_time
-        print(f"✅ Video generation completed in {elapsed:.3f}s")
+        if outcome == 'unreachable':
+            logger.error(f"❌ Unable to confirm video status after {elapsed:.1f}s")
+            return {
+                'success': False,
+                'error': 'status_unavailable',
+                'operation_id': operation_id,
+                'completion_time': elapsed
+            }
         
-        print("🎬 VIDEO GENERATION COMPLETE!")
-        print("=" * 40)
-        print(f"✅ SUCCESS - Video generated!")
-        print(f"📝 Video: Mountain meadow cinematic scene")
-        print(f"🆔 Operation ID: {operation_id}")
-        print(f"⚡ Generation Time: {elapsed:.3f} seconds")
-        print()
-        print("🚀 Professional video ready!")
-        
-        return {
-            'success': True,
-            'operation_id': operation_id,
-            'completion_time': elapsed,
-            'prompt': video_prompt,
-            'status': 'completed'
-        }
+        return _emit_completion(
+            outcome, status_data, elapsed, operation_id, video_prompt, prompt_preview, customer_name
+        )
         
     except Exception as e:
-        print(f"❌ Video generation error: {e}")
-        return None
+        logger.error(f"❌ Video generation error: {e}")
+        return {'success': False, 'error': str(e)}
+
+def create_video_now():
+    """Create a professional video immediately"""
+    return create_video_with_prompt(DEFAULT_PROMPT, DEFAULT_CUSTOMER)
+
+async def create_video_now_async():
+    """Async version of create_video_now"""
+    return await create_video_with_prompt_async(DEFAULT_PROMPT, DEFAULT_CUSTOMER)
 
 if __name__ == "__main__":
-    result = create_video_with_prompt(video_prompt, customer_name)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    
+    result = create_video_now()
     
     if result and result.get('success'):
         print()
@@ -5,34 +5,28 @@ Format Google Cloud credentials for proper usage
 
 import os
 import json
-import tempfile
+from credentials_common import read_raw_credentials, parse_credentials, credentials_file
 
 def format_credentials():
     """Format credentials from environment variable"""
     
     # Get the raw credentials
-    creds_raw = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', '')
+    creds_raw = read_raw_credentials()
     
     if not creds_raw:
         print("❌ No GOOGLE_APPLICATION_CREDENTIALS found")
         return None
     
     try:
-        # Parse as JSON to validate
-        creds_dict = json.loads(creds_raw)
-        
-        # Validate required fields
-        required_fields = ['type', 'project_id', 'private_key', 'client_email']
-        missing_fields = [field for field in required_fields if field not in creds_dict]
+        # Parse as JSON to validate required fields
+        creds_dict, missing_fields = parse_credentials(creds_raw)
         
         if missing_fields:
             print(f"❌ Missing required fields: {missing_fields}")
             return None
         
         # Create temporary file with proper formatting
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(creds_dict, f, indent=2)
-            temp_path = f.name
+        temp_path = credentials_file(creds_raw)
         
         print(f"✅ Credentials formatted successfully")
         print(f"Project ID: {creds_dict.get('project_id')}")
@@ -59,11 +53,9 @@ if __name__ == "__main__":
         print(f"\n📝 Use this file path: {temp_file}")
         
         # Test reading the file
-        try:
-            with open(temp_file, 'r') as f:
-                test_data = json.load(f)
+        if os.access(temp_file, os.R_OK):
             print("✅ Credentials file is readable")
-        except Exception as e:
-            print(f"❌ Error reading temp file: {e}")
+        else:
+            print(f"❌ Error reading temp file: {temp_file}")
     
     print("\n" + "=" * 50)
\ No newline at end of file
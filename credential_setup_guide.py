@@ -3,15 +3,28 @@
 Credential Setup Guide for VEO 3 Integration
 """
 
-import os
 import json
+from credentials_common import read_raw_credentials, parse_credentials
+
+def _report_invalid_json(creds_env):
+    """Classify credentials that are not valid JSON"""
+    
+    print("❌ Not valid JSON format")
+    
+    # Check if it looks like raw credential content
+    if '"type":' in creds_env and '"project_id":' in creds_env:
+        print("🔧 Appears to be JSON content but improperly formatted")
+        return "needs_formatting"
+    else:
+        print("❌ Unrecognized credential format")
+        return False
 
 def analyze_current_credentials():
     """Analyze what's currently in the credentials"""
     
     print("Analyzing current credential format...")
     
-    creds_env = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', '')
+    creds_env = read_raw_credentials()
     
     if not creds_env:
         print("❌ GOOGLE_APPLICATION_CREDENTIALS is empty")
@@ -21,14 +34,15 @@ def analyze_current_credentials():
     print(f"📊 Length: {len(creds_env)} characters")
     print(f"📊 Starts with: {creds_env[:50]}...")
     
+    # A JSON object must start with '{'; anything else cannot parse
+    if not creds_env.lstrip().startswith('{'):
+        return _report_invalid_json(creds_env)
+    
     # Check if it's valid JSON
     try:
-        data = json.loads(creds_env)
+        data, missing_fields = parse_credentials(creds_env)
         print("✅ Valid JSON detected")
         
-        required_fields = ['type', 'project_id', 'private_key', 'client_email']
-        missing_fields = [field for field in required_fields if field not in data]
-        
         if missing_fields:
             print(f"❌ Missing fields: {missing_fields}")
             return False
@@ -37,15 +51,7 @@ def analyze_current_credentials():
             return True
             
     except json.JSONDecodeError:
-        print("❌ Not valid JSON format")
-        
-        # Check if it looks like raw credential content
-        if '"type":' in creds_env and '"project_id":' in creds_env:
-            print("🔧 Appears to be JSON content but improperly formatted")
-            return "needs_formatting"
-        else:
-            print("❌ Unrecognized credential format")
-            return False
+        return _report_invalid_json(creds_env)
 
 def show_setup_instructions():
     """Show instructions for proper setup"""
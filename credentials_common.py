@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Shared loader for the Google Cloud service account credentials
+"""
+
+import os
+import json
+import functools
+import tempfile
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+CREDENTIALS_ENV = 'GOOGLE_APPLICATION_CREDENTIALS'
+REQUIRED_FIELDS = ('type', 'project_id', 'private_key', 'client_email')
+
+def read_raw_credentials():
+    """Return the raw credentials JSON from the environment ('' if unset)"""
+    return os.environ.get(CREDENTIALS_ENV, '')
+
+@functools.lru_cache(maxsize=1)
+def parse_credentials(creds_raw):
+    """Parse credentials JSON and list any missing required fields
+
+    Cached on the raw string, so repeat calls with the same credentials
+    skip the JSON parse. Returns ``(creds_dict, missing_fields)``; the dict
+    is shared between callers and must not be modified. Raises
+    json.JSONDecodeError for malformed input (orjson's error subclasses it).
+    """
+    creds_dict = orjson.loads(creds_raw) if ORJSON_AVAILABLE else json.loads(creds_raw)
+    if not isinstance(creds_dict, dict):
+        return creds_dict, list(REQUIRED_FIELDS)
+    
+    # Presence and type in one pass: a required field must hold a string
+    missing_fields = [field for field in REQUIRED_FIELDS if not isinstance(creds_dict.get(field), str)]
+    return creds_dict, missing_fields
+
+@functools.lru_cache(maxsize=1)
+def _write_credentials_file(creds_raw):
+    creds_dict, _ = parse_credentials(creds_raw)
+    
+    # Compact JSON in one write; mkstemp opens the file O_CLOEXEC with 0600
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(creds_dict)
+    else:
+        data = json.dumps(creds_dict, separators=(',', ':')).encode('utf-8')
+    
+    fd, temp_path = tempfile.mkstemp(suffix='.json')
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return temp_path
+
+def credentials_file(creds_raw):
+    """Return a temp JSON file holding the credentials, written once per value"""
+    temp_path = _write_credentials_file(creds_raw)
+    if not os.path.exists(temp_path):
+        # The file was cleaned up since it was cached; write a fresh one
+        _write_credentials_file.cache_clear()
+        temp_path = _write_credentials_file(creds_raw)
+    return temp_path
@@ -5,12 +5,12 @@ Fix Google Cloud credentials for VEO 2 access
 
 import os
 import json
-import tempfile
+from credentials_common import read_raw_credentials, parse_credentials, credentials_file
 
 def fix_credentials():
     """Fix and validate Google Cloud credentials"""
     
-    creds_raw = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS', '')
+    creds_raw = read_raw_credentials()
     
     print(f"Raw credentials length: {len(creds_raw)}")
     print(f"First 50 chars: {creds_raw[:50]}")
@@ -29,30 +29,25 @@ def fix_credentials():
             print("❌ Credentials don't start with '{' - not valid JSON")
             return None
         
-        # Parse JSON
-        creds_dict = json.loads(creds_clean)
-        
-        # Validate structure
-        required_fields = ['type', 'project_id', 'private_key', 'client_email']
-        for field in required_fields:
-            if field not in creds_dict:
-                print(f"❌ Missing field: {field}")
-                return None
+        # Parse JSON and validate structure
+        creds_dict, missing_fields = parse_credentials(creds_clean)
+        if missing_fields:
+            print(f"❌ Missing field: {missing_fields[0]}")
+            return None
         
         print("✅ Credentials are valid JSON!")
         print(f"Project: {creds_dict['project_id']}")
         print(f"Service Account: {creds_dict['client_email']}")
         
         # Create temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(creds_dict, f, indent=2)
-            temp_path = f.name
+        temp_path = credentials_file(creds_clean)
         
         print(f"✅ Created temp file: {temp_path}")
         
-        # Test the temp file
-        with open(temp_path, 'r') as f:
-            test_data = json.load(f)
+        # Test the temp file; its content is the dict already parsed above
+        if not os.access(temp_path, os.R_OK):
+            print("❌ Temp file is not readable")
+            return None
         
         print("✅ Temp file is readable")
         return temp_path
@@ -5,13 +5,34 @@ Creates unique videos for each customer order instead of using gallery demos
 
 import os
 import time
+import queue
 import shutil
-from PIL import Image, ImageDraw, ImageFont
+import threading
+import functools
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import cv2
 import numpy as np
 from typing import Dict, Any
 
-def create_customer_specific_video(image_path: str, prompt: str, order_id: int = None) -> str:
+# H.264 encoder for the ffmpeg pipe: libx264 by default, or set to
+# h264_nvenc / h264_videotoolbox on hosts with hardware encoding
+VIDEO_ENCODER = os.environ.get('CUSTOMER_VIDEO_ENCODER', 'libx264')
+ENCODER_QUALITY_ARGS = {
+    'libx264': ['-preset', 'ultrafast', '-crf', '23'],
+    'h264_nvenc': ['-preset', 'p1', '-cq', '23'],
+    'h264_videotoolbox': ['-q:v', '65'],
+}
+
+# Default output size, matching the 1280x720 HD requested from Vertex AI
+DEFAULT_WIDTH, DEFAULT_HEIGHT = 1280, 720
+
+# Text positions and sizes are laid out for 1080p and scaled to the output height
+TEXT_LAYOUT_HEIGHT = 1080
+
+def create_customer_specific_video(image_path: str, prompt: str, order_id: int = None,
+                                   width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT) -> str:
     """Create a unique video for this customer order"""
     
     print(f"🎬 Creating customer-specific video")
@@ -28,7 +49,7 @@ def create_customer_specific_video(image_path: str, prompt: str, order_id: int =
     
     try:
         # Create a custom video that incorporates the customer's image and prompt
-        create_custom_video_with_image(image_path, prompt, customer_video_path)
+        create_custom_video_with_image(image_path, prompt, customer_video_path, width, height)
         
         if os.path.exists(customer_video_path):
             file_size = os.path.getsize(customer_video_path)
@@ -36,29 +57,180 @@ def create_customer_specific_video(image_path: str, prompt: str, order_id: int =
             return customer_video_path
         else:
             # No gallery fallback - create text-only customer video
-            create_text_only_video(prompt, customer_video_path)
+            create_text_only_video(prompt, customer_video_path, width, height)
             return customer_video_path
     
     except Exception as e:
         print(f"❌ Error creating custom video: {e}")
         # No fallback - always create unique customer content
-        create_text_only_video(prompt, customer_video_path)
+        create_text_only_video(prompt, customer_video_path, width, height)
         return customer_video_path
 
-def create_custom_video_with_image(image_path: str, prompt: str, output_path: str):
+class _ThreadedVideoWriter:
+    """Encode frames on a background thread while the next one is rendered
+    
+    Wraps a cv2.VideoWriter or _FFmpegVideoWriter with the same
+    write()/release() interface. The writer takes ownership of each frame,
+    so callers must not modify a frame after writing it. Use it as a
+    context manager so the thread and encoder are released on errors too.
+    """
+    
+    def __init__(self, writer, max_pending: int = 8):
+        self._writer = writer
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def _run(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            if self._error is None:
+                try:
+                    self._writer.write(frame)
+                except Exception as e:
+                    # Keep draining so the producer never blocks on a full queue
+                    self._error = e
+    
+    def write(self, frame: np.ndarray):
+        # Both encoders need one C-contiguous BGR buffer; rendered frames
+        # already are, so this only copies a frame that is not
+        self._queue.put(np.ascontiguousarray(frame))
+    
+    def release(self):
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._writer.release()
+        except Exception as e:
+            # The encoder's own error (e.g. ffmpeg's stderr) explains a
+            # failed write better than the write error itself
+            if self._error is not None:
+                raise e from self._error
+            raise
+        if self._error is not None:
+            raise self._error
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.release()
+            return
+        # Rendering failed: still stop the thread and free the encoder, but
+        # let the original exception propagate instead of an encoder error
+        try:
+            self.release()
+        except Exception as release_error:
+            print(f"⚠️ Error releasing video writer: {release_error}")
+
+class _FFmpegVideoWriter:
+    """Pipe raw BGR frames to an ffmpeg H.264 encoder"""
+    
+    def __init__(self, ffmpeg_path: str, output_path: str, fps: int, width: int, height: int):
+        cmd = [
+            ffmpeg_path, '-y', '-loglevel', 'error',
+            '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+            '-s', f'{width}x{height}', '-r', str(fps),
+            '-i', '-',
+            '-c:v', VIDEO_ENCODER, *ENCODER_QUALITY_ARGS.get(VIDEO_ENCODER, []),
+            '-pix_fmt', 'yuv420p', '-movflags', '+faststart',
+            output_path
+        ]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+    
+    def write(self, frame: np.ndarray):
+        # Frames are C-contiguous uint8, so the buffer goes straight to the pipe
+        self._proc.stdin.write(frame)
+    
+    def release(self):
+        try:
+            self._proc.stdin.close()
+        except BrokenPipeError:
+            # ffmpeg exited early; its stderr and exit code below say why
+            pass
+        stderr = self._proc.stderr.read()
+        if self._proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg encode failed: {stderr.decode(errors='replace').strip()}")
+
+def _open_video_writer(output_path: str, fps: int, width: int, height: int) -> _ThreadedVideoWriter:
+    """Open a threaded H.264 writer, falling back to OpenCV's mp4v encoder without ffmpeg"""
+    ffmpeg_path = shutil.which('ffmpeg')
+    if ffmpeg_path:
+        writer = _FFmpegVideoWriter(ffmpeg_path, output_path, fps, width, height)
+    else:
+        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+        writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height), isColor=True)
+    return _ThreadedVideoWriter(writer)
+
+def _gradient_background(width: int, height: int, base: int, span: int, to_bgr) -> np.ndarray:
+    """Build a full frame holding a vertical gradient, once per video
+    
+    Row ``y`` has intensity ``int(base + (y / height) * span)``; ``to_bgr``
+    maps the intensity column to its blue, green and red channels.
+    """
+    intensity = np.linspace(base, base + span, height, endpoint=False).astype(np.int64)
+    column = np.stack(to_bgr(intensity), axis=1).astype(np.uint8)
+    return np.broadcast_to(column[:, None, :], (height, width, 3)).copy()
+
+def _render_frames(render_frame, total_frames: int, out: _ThreadedVideoWriter):
+    """Render frames on a thread pool and write them to ``out`` in order
+    
+    Frames only depend on their frame number, and OpenCV and NumPy release
+    the GIL while drawing, so several frames render at once. At most two
+    frames per worker are in flight to bound memory.
+    """
+    workers = os.cpu_count() or 1
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for frame_num in range(total_frames):
+            pending.append(executor.submit(render_frame, frame_num))
+            if len(pending) >= workers * 2:
+                out.write(pending.popleft().result())
+        while pending:
+            out.write(pending.popleft().result())
+
+def _render_custom_frame(frame_num: int, total_frames: int, background: np.ndarray,
+                         customer_img, x_offsets: np.ndarray, y_offsets: np.ndarray) -> np.ndarray:
+    """Render one frame of the customer image video"""
+    height, width = background.shape[:2]
+    
+    # Start from the background, which already carries the static text
+    frame = background.copy()
+    
+    # Add customer image if available
+    if customer_img is not None:
+        # Position for this frame (moving slightly for animation)
+        x_offset = int(x_offsets[frame_num])
+        y_offset = int(y_offsets[frame_num])
+        
+        # Clip the image to the frame rather than dropping it near the edges
+        x_end = min(x_offset + customer_img.shape[1], width)
+        y_end = min(y_offset + customer_img.shape[0], height)
+        if x_end > x_offset and y_end > y_offset:
+            frame[y_offset:y_end, x_offset:x_end] = customer_img[:y_end-y_offset, :x_end-x_offset]
+    
+    # Add frame number for uniqueness
+    s = height / TEXT_LAYOUT_HEIGHT
+    cv2.putText(frame, f"Frame {frame_num+1}/{total_frames}", 
+               (width - int(300*s), height - int(50*s)), cv2.FONT_HERSHEY_SIMPLEX, 0.7*s, (150, 150, 150), max(1, round(s)))
+    
+    return frame
+
+def create_custom_video_with_image(image_path: str, prompt: str, output_path: str,
+                                   width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT):
     """Create a custom video incorporating the customer's uploaded image"""
     
     try:
         # Video parameters
-        width, height = 1920, 1080
+        s = height / TEXT_LAYOUT_HEIGHT
         fps = 30
         duration = 5  # 5 seconds
         total_frames = fps * duration
         
-        # Create video writer
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
-        
         # Load and resize customer image if it exists
         customer_img = None
         if os.path.exists(image_path):
@@ -69,42 +241,32 @@ def create_custom_video_with_image(image_path: str, prompt: str, output_path: st
             except:
                 customer_img = None
         
-        for frame_num in range(total_frames):
-            # Create base frame
-            frame = np.zeros((height, width, 3), dtype=np.uint8)
-            
-            # Add gradient background
-            for y in range(height):
-                intensity = int(50 + (y / height) * 100)
-                frame[y, :] = [intensity//3, intensity//2, intensity]
-            
-            # Add customer image if available
-            if customer_img is not None:
-                # Calculate position (moving slightly for animation)
-                x_offset = int(width//4 + 50 * np.sin(frame_num * 0.1))
-                y_offset = int(height//4 + 30 * np.cos(frame_num * 0.1))
-                
-                # Ensure image fits in frame
-                img_h, img_w = customer_img.shape[:2]
-                if x_offset + img_w < width and y_offset + img_h < height:
-                    frame[y_offset:y_offset+img_h, x_offset:x_offset+img_w] = customer_img
-            
-            # Add text overlay with prompt
-            cv2.putText(frame, "DreamFrame Video Production", 
-                       (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 2)
-            
-            # Add customer prompt (truncated if too long)
-            prompt_text = prompt[:50] + "..." if len(prompt) > 50 else prompt
-            cv2.putText(frame, prompt_text, 
-                       (50, height - 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (200, 200, 255), 2)
-            
-            # Add frame number for uniqueness
-            cv2.putText(frame, f"Frame {frame_num+1}/{total_frames}", 
-                       (width - 300, height - 50), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (150, 150, 150), 1)
-            
-            out.write(frame)
+        # Gradient background and static text are the same for every frame,
+        # so draw the text once; the moving image never reaches these rows
+        background = _gradient_background(width, height, 50, 100, lambda i: (i//3, i//2, i))
+        
+        # Add text overlay with prompt
+        cv2.putText(background, "DreamFrame Video Production", 
+                   (int(50*s), int(50*s)), cv2.FONT_HERSHEY_SIMPLEX, 1.5*s, (255, 255, 255), max(1, round(2*s)))
+        
+        # Add customer prompt (truncated if too long)
+        prompt_text = prompt[:50] + "..." if len(prompt) > 50 else prompt
+        cv2.putText(background, prompt_text, 
+                   (int(50*s), height - int(100*s)), cv2.FONT_HERSHEY_SIMPLEX, 1*s, (200, 200, 255), max(1, round(2*s)))
+        
+        # Animation offsets for every frame, computed in one pass
+        angles = np.arange(total_frames) * 0.1
+        x_offsets = (width//4 + 50*s * np.sin(angles)).astype(np.int32)
+        y_offsets = (height//4 + 30*s * np.cos(angles)).astype(np.int32)
+        
+        render_frame = functools.partial(_render_custom_frame, total_frames=total_frames,
+                                         background=background, customer_img=customer_img,
+                                         x_offsets=x_offsets, y_offsets=y_offsets)
+        
+        # Create video writer
+        with _open_video_writer(output_path, fps, width, height) as out:
+            _render_frames(render_frame, total_frames, out)
         
-        out.release()
         print(f"✅ Custom video created with {total_frames} frames")
         
     except Exception as e:
@@ -113,37 +275,32 @@ def create_custom_video_with_image(image_path: str, prompt: str, output_path: st
 
 # Removed gallery fallback function - all videos are now customer-specific
 
-def create_text_only_video(prompt: str, output_path: str):
+def create_text_only_video(prompt: str, output_path: str,
+                           width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT):
     """Create a simple text-based video as last resort"""
     
-    width, height = 1920, 1080
+    s = height / TEXT_LAYOUT_HEIGHT
     fps = 30
     duration = 3
     total_frames = fps * duration
     
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+    # Nothing in this video moves, so render one frame and repeat it
+    frame = _gradient_background(width, height, 30, 80, lambda i: (i, i//2, i*2//3))
     
-    for frame_num in range(total_frames):
-        # Create gradient background
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        for y in range(height):
-            intensity = int(30 + (y / height) * 80)
-            frame[y, :] = [intensity, intensity//2, intensity*2//3]
-        
-        # Add text
-        cv2.putText(frame, "DreamFrame Custom Video", 
-                   (width//2 - 300, height//2 - 100), cv2.FONT_HERSHEY_SIMPLEX, 2, (255, 255, 255), 3)
-        
-        cv2.putText(frame, prompt[:60], 
-                   (width//2 - 400, height//2), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (200, 255, 200), 2)
-        
-        cv2.putText(frame, "Your personalized video is ready!", 
-                   (width//2 - 250, height//2 + 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 200), 2)
-        
-        out.write(frame)
+    # Add text
+    cv2.putText(frame, "DreamFrame Custom Video", 
+               (width//2 - int(300*s), height//2 - int(100*s)), cv2.FONT_HERSHEY_SIMPLEX, 2*s, (255, 255, 255), max(1, round(3*s)))
+    
+    cv2.putText(frame, prompt[:60], 
+               (width//2 - int(400*s), height//2), cv2.FONT_HERSHEY_SIMPLEX, 1.2*s, (200, 255, 200), max(1, round(2*s)))
+    
+    cv2.putText(frame, "Your personalized video is ready!", 
+               (width//2 - int(250*s), height//2 + int(100*s)), cv2.FONT_HERSHEY_SIMPLEX, 1*s, (255, 255, 200), max(1, round(2*s)))
+    
+    with _open_video_writer(output_path, fps, width, height) as out:
+        for _ in range(total_frames):
+            out.write(frame)
     
-    out.release()
     print(f"✅ Created text-only customer video")
 
 def create_customer_video(image_path: str, prompt: str, duration: int = 5, order_id: int = None) -> Dict[str, Any]:
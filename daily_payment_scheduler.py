@@ -6,11 +6,11 @@ Automated daily testing with intelligent scheduling and failure recovery
 
 import os
 import sys
-import time
 import schedule
 import logging
 import threading
 import datetime
+from collections import Counter
 from payment_health_monitor import PaymentHealthMonitor, HealthCheckResult
 from typing import List
 
@@ -25,6 +25,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Longest single sleep between jobs, so the loop re-reads the wall clock
+# at least hourly (e.g. after the host suspends or the clock is adjusted)
+MAX_IDLE_SECONDS = 3600
+
 class DailyPaymentScheduler:
     """Daily payment system health check scheduler"""
     
@@ -33,6 +37,7 @@ class DailyPaymentScheduler:
         self.last_run_status = None
         self.consecutive_failures = 0
         self.running = False
+        self._stop_event = threading.Event()
         
     def run_daily_check(self):
         """Run the daily payment system health check"""
@@ -42,9 +47,14 @@ class DailyPaymentScheduler:
             # Run health checks
             results = self.monitor.run_health_checks()
             
-            # Analyze results
-            failed_tests = [r for r in results if r.status == 'FAIL']
-            warning_tests = [r for r in results if r.status == 'WARNING']
+            # Analyze results in one pass
+            failed_tests = []
+            warning_tests = []
+            for r in results:
+                if r.status == 'FAIL':
+                    failed_tests.append(r)
+                elif r.status == 'WARNING':
+                    warning_tests.append(r)
             
             # Update status tracking
             if failed_tests:
@@ -118,9 +128,10 @@ class DailyPaymentScheduler:
     
     def _log_daily_summary(self, results: List[HealthCheckResult]):
         """Log daily summary statistics"""
-        passed = len([r for r in results if r.status == 'PASS'])
-        failed = len([r for r in results if r.status == 'FAIL'])
-        warnings = len([r for r in results if r.status == 'WARNING'])
+        status_counts = Counter(r.status for r in results)
+        passed = status_counts['PASS']
+        failed = status_counts['FAIL']
+        warnings = status_counts['WARNING']
         
         logger.info("📊 Daily Payment Health Summary:")
         logger.info(f"   ✅ Passed: {passed}")
@@ -149,6 +160,7 @@ class DailyPaymentScheduler:
         schedule.every().day.at("20:00").do(self.run_daily_check)
         
         self.running = True
+        self._stop_event.clear()
         
         logger.info("⏰ Scheduled daily checks:")
         logger.info("   📅 8:00 AM - Primary daily health check")
@@ -158,15 +170,21 @@ class DailyPaymentScheduler:
         logger.info("🔄 Running initial health check...")
         self.run_daily_check()
         
-        # Start scheduler loop
+        # Start scheduler loop: sleep until the next job is due instead of
+        # polling, and wake immediately when stop_scheduler() is called
         while self.running:
+            idle_seconds = schedule.idle_seconds()
+            if idle_seconds is None:
+                break  # No jobs scheduled
+            if idle_seconds > 0 and self._stop_event.wait(timeout=min(idle_seconds, MAX_IDLE_SECONDS)):
+                break
             schedule.run_pending()
-            time.sleep(60)  # Check every minute
     
     def stop_scheduler(self):
         """Stop the scheduler"""
         logger.info("🛑 Stopping daily payment scheduler...")
         self.running = False
+        self._stop_event.set()
     
     def get_status(self):
         """Get current scheduler status"""
@@ -5,6 +5,11 @@ Debug SendGrid API key configuration
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+
+SENDGRID_API = 'https://api.sendgrid.com/v3'
 
 def debug_sendgrid():
     """Debug SendGrid API key and permissions"""
@@ -28,10 +33,43 @@ def debug_sendgrid():
         'Content-Type': 'application/json'
     }
     
+    test_payload = {
+        "personalizations": [
+            {
+                "to": [{"email": "test@example.com"}],
+                "subject": "SendGrid Test"
+            }
+        ],
+        "from": {"email": "noreply@dreamframe.com"},
+        "content": [
+            {
+                "type": "text/plain",
+                "value": "Test email"
+            }
+        ]
+    }
+    
+    # The three probes are independent: send them together over one
+    # session and report the results in order as they are needed
+    session = requests.Session()
+    session.headers.update(headers)
+    # One pooled socket per probe, so none is opened and then thrown away,
+    # and a dropped connection on the GET probes is retried rather than
+    # reported as a key problem (POST is never retried, so no double send)
+    session.mount('https://', HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=3,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    ))
+    with session, ThreadPoolExecutor(max_workers=3) as executor:
+        profile_future = executor.submit(session.get, f'{SENDGRID_API}/user/profile')
+        scopes_future = executor.submit(session.get, f'{SENDGRID_API}/scopes')
+        send_future = executor.submit(session.post, f'{SENDGRID_API}/mail/send', json=test_payload)
+    
     # Test 1: Check API key validity
     print("\n🔍 Testing API key validity...")
     try:
-        response = requests.get('https://api.sendgrid.com/v3/user/profile', headers=headers)
+        response = profile_future.result()
         print(f"   Profile API: {response.status_code}")
         if response.status_code == 200:
             print("   ✅ API key is valid")
@@ -45,7 +83,7 @@ def debug_sendgrid():
     # Test 2: Check scopes/permissions
     print("\n🔍 Testing API key scopes...")
     try:
-        response = requests.get('https://api.sendgrid.com/v3/scopes', headers=headers)
+        response = scopes_future.result()
         print(f"   Scopes API: {response.status_code}")
         if response.status_code == 200:
             scopes = response.json()
@@ -61,27 +99,8 @@ def debug_sendgrid():
     
     # Test 3: Simple mail send test
     print("\n🔍 Testing mail send capability...")
-    
-    test_payload = {
-        "personalizations": [
-            {
-                "to": [{"email": "test@example.com"}],
-                "subject": "SendGrid Test"
-            }
-        ],
-        "from": {"email": "noreply@dreamframe.com"},
-        "content": [
-            {
-                "type": "text/plain",
-                "value": "Test email"
-            }
-        ]
-    }
-    
     try:
-        response = requests.post('https://api.sendgrid.com/v3/mail/send', 
-                               headers=headers, 
-                               json=test_payload)
+        response = send_future.result()
         print(f"   Mail Send API: {response.status_code}")
         if response.status_code == 202:
             print("   ✅ Mail send permission working")
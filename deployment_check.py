@@ -7,7 +7,10 @@ Checks all deployment requirements and configurations
 import os
 import sys
 import logging
+import py_compile
+import importlib.util
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,10 +26,10 @@ def check_deployment_files():
         'start.sh'
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not Path(file).exists():
-            missing_files.append(file)
+    # Stat the files concurrently so cold-cache lookups overlap
+    with ThreadPoolExecutor(max_workers=len(required_files)) as executor:
+        present = list(executor.map(lambda file: Path(file).exists(), required_files))
+    missing_files = [file for file, exists in zip(required_files, present) if not exists]
     
     if missing_files:
         logger.error(f"Missing deployment files: {missing_files}")
@@ -48,12 +51,18 @@ def check_wsgi_configuration():
 def check_gunicorn_config():
     """Verify gunicorn configuration"""
     try:
-        # Check if gunicorn.conf.py exists and is syntactically valid
-        with open('gunicorn.conf.py', 'r') as f:
-            config_content = f.read()
+        # Check if gunicorn.conf.py exists and is syntactically valid. The
+        # compiled .pyc doubles as a cache: if it is newer than the source,
+        # the last run already validated this exact file
+        config_path = 'gunicorn.conf.py'
+        cached_path = importlib.util.cache_from_source(config_path)
+        try:
+            up_to_date = os.stat(cached_path).st_mtime >= os.stat(config_path).st_mtime
+        except FileNotFoundError:
+            up_to_date = False
         
-        # Try to compile the configuration
-        compile(config_content, 'gunicorn.conf.py', 'exec')
+        if not up_to_date:
+            py_compile.compile(config_path, cfile=cached_path, doraise=True)
         logger.info("✅ Gunicorn configuration is valid")
         return True
     except Exception as e:
@@ -4,6 +4,7 @@ Test direct download functionality
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Check if videos exist and their sizes
 files_to_check = [
@@ -15,10 +16,21 @@ files_to_check = [
     'kindness_video.mp4'
 ]
 
+def file_size(file_path):
+    """Return the file size in bytes, or None if it does not exist"""
+    # One stat call covers both the existence check and the size
+    try:
+        return os.stat(file_path).st_size
+    except FileNotFoundError:
+        return None
+
 print("=== FILE STATUS CHECK ===")
-for file_path in files_to_check:
-    if os.path.exists(file_path):
-        size = os.path.getsize(file_path)
+# Stat the files concurrently so cold-cache lookups overlap
+with ThreadPoolExecutor(max_workers=len(files_to_check)) as executor:
+    sizes = list(executor.map(file_size, files_to_check))
+
+for file_path, size in zip(files_to_check, sizes):
+    if size is not None:
         print(f"✅ {file_path}: {size} bytes")
     else:
         print(f"❌ {file_path}: NOT FOUND")
@@ -5,6 +5,7 @@ Test the direct aiplatform approach suggested by user
 
 import os
 import sys
+import asyncio
 sys.path.append('.')
 
 from google.cloud import aiplatform
@@ -12,6 +13,16 @@ from datetime import datetime
 import json
 import time
 
+def _preview(value, limit=200):
+    """Shorten long strings (such as base64 video data) for printing"""
+    if isinstance(value, str) and len(value) > limit:
+        return f"{value[:limit]}... ({len(value):,} chars)"
+    if isinstance(value, dict):
+        return {key: _preview(item, limit) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_preview(item, limit) for item in value]
+    return value
+
 def test_direct_aiplatform_veo3():
     """Test VEO 3 using direct aiplatform approach"""
     
@@ -46,14 +57,15 @@ def test_direct_aiplatform_veo3():
             print(f"📋 Response content:")
             
             if hasattr(response, 'predictions'):
-                print(f"Predictions: {response.predictions}")
+                print(f"Predictions: {_preview(response.predictions)}")
             
             if hasattr(response, 'deployed_model_id'):
                 print(f"Model ID: {response.deployed_model_id}")
             
-            # Print full response
+            # Print full response; Endpoint.predict returns a Prediction
+            # NamedTuple of plain Python values, so it serializes directly
             print("📊 Full response:")
-            print(json.dumps(str(response), indent=2))
+            print(json.dumps(_preview(response._asdict()), indent=2, default=str))
             
             return {
                 'success': True,
@@ -97,7 +109,79 @@ def test_direct_aiplatform_veo3():
         print(f"❌ AI Platform initialization error: {e}")
         return None
 
-def test_alternative_veo3_access():
+async def predict_veo3_prompts(prompts):
+    """Send one VEO 3 prediction per prompt concurrently over one client
+    
+    The PredictionServiceAsyncClient is created here, inside the running
+    event loop, since grpc.aio channels are bound to the loop they were
+    created on. It is closed before returning, so each asyncio.run()
+    gets a fresh channel.
+    """
+    from google.cloud import aiplatform_v1
+    
+    client = aiplatform_v1.PredictionServiceAsyncClient()
+    try:
+        # Construct endpoint path
+        endpoint_path = client.endpoint_path(
+            project="dreamframe",
+            location="us-central1", 
+            endpoint="veo-3.0-generate-preview"
+        )
+        
+        print(f"📍 Endpoint path: {endpoint_path}")
+        
+        # Create prediction requests
+        requests = [
+            aiplatform_v1.PredictRequest(
+                endpoint=endpoint_path,
+                instances=[{"prompt": prompt}]
+            )
+            for prompt in prompts
+        ]
+        
+        print("📡 Sending prediction service request...")
+        return await asyncio.gather(*(client.predict(request=request) for request in requests))
+    finally:
+        await client.transport.close()
+
+def _list_veo_models():
+    """List the project's models and return those with 'veo' in their name"""
+    try:
+        from google.cloud import aiplatform_v1
+        from google.protobuf import field_mask_pb2
+        
+        # Display-name filters only support exact matches, so the 'veo'
+        # match stays client-side; ask for just the two fields it needs
+        # in large pages to keep the scan to as few, small responses as possible
+        model_client = aiplatform_v1.ModelServiceClient(
+            client_options={"api_endpoint": "us-central1-aiplatform.googleapis.com"}
+        )
+        list_request = aiplatform_v1.ListModelsRequest(
+            parent="projects/dreamframe/locations/us-central1",
+            page_size=100,
+            read_mask=field_mask_pb2.FieldMask(paths=["name", "display_name"])
+        )
+        models = list(model_client.list_models(request=list_request))
+        print(f"✅ Found {len(models)} models")
+        
+        # Look for VEO models
+        veo_models = []
+        for model in models:
+            if 'veo' in str(model.display_name).lower():
+                veo_models.append(model)
+                print(f"🎥 VEO Model: {model.display_name}")
+        
+        if veo_models:
+            print(f"✅ Found {len(veo_models)} VEO models")
+        else:
+            print("⚠️  No VEO models found in listing")
+        return veo_models
+            
+    except Exception as list_error:
+        print(f"❌ Model listing error: {list_error}")
+        return []
+
+async def test_alternative_veo3_access():
     """Test alternative VEO 3 access methods"""
     
     print("\n🔬 Testing Alternative VEO 3 Access Methods")
@@ -107,62 +191,23 @@ def test_alternative_veo3_access():
         # Initialize with explicit credentials
         print("🔐 Initializing with explicit authentication...")
         
-        aiplatform.init(
+        await asyncio.to_thread(
+            aiplatform.init,
             project="dreamframe", 
             location="us-central1",
             credentials=None  # Use environment credentials
         )
         
-        # List available models
+        # List available models (blocking client, so off the event loop)
         print("📋 Listing available models...")
-        
-        try:
-            models = aiplatform.Model.list()
-            print(f"✅ Found {len(models)} models")
-            
-            # Look for VEO models
-            veo_models = []
-            for model in models:
-                if 'veo' in str(model.display_name).lower():
-                    veo_models.append(model)
-                    print(f"🎥 VEO Model: {model.display_name}")
-            
-            if veo_models:
-                print(f"✅ Found {len(veo_models)} VEO models")
-                return veo_models
-            else:
-                print("⚠️  No VEO models found in listing")
-                
-        except Exception as list_error:
-            print(f"❌ Model listing error: {list_error}")
+        veo_models = await asyncio.to_thread(_list_veo_models)
+        if veo_models:
+            return veo_models
             
         # Try direct prediction service
         print("🔄 Trying prediction service...")
         
-        from google.cloud import aiplatform_v1
-        
-        client = aiplatform_v1.PredictionServiceClient()
-        
-        # Construct endpoint path
-        endpoint_path = client.endpoint_path(
-            project="dreamframe",
-            location="us-central1", 
-            endpoint="veo-3.0-generate-preview"
-        )
-        
-        print(f"📍 Endpoint path: {endpoint_path}")
-        
-        # Create prediction request
-        instance = {"prompt": "Test video generation"}
-        instances = [instance]
-        
-        request = aiplatform_v1.PredictRequest(
-            endpoint=endpoint_path,
-            instances=instances
-        )
-        
-        print("📡 Sending prediction service request...")
-        response = client.predict(request=request)
+        response, = await predict_veo3_prompts(["Test video generation"])
         
         print("🎉 PREDICTION SERVICE SUCCESS!")
         print(f"📊 Response: {response}")
@@ -177,17 +222,26 @@ def test_alternative_veo3_access():
         print(f"❌ Alternative access error: {e}")
         return None
 
+async def run_probes():
+    """Run the direct and alternative probes concurrently
+    
+    Both spend nearly all their time waiting on Vertex AI, so running them
+    side by side takes as long as the slower one. Their progress output
+    interleaves.
+    """
+    return await asyncio.gather(
+        asyncio.to_thread(test_direct_aiplatform_veo3),
+        test_alternative_veo3_access()
+    )
+
 def main():
     """Test direct AI Platform VEO 3 access"""
     
     print("🚀 Direct Google Cloud AI Platform VEO 3 Test")
     print("=" * 55)
     
-    # Test direct approach
-    result1 = test_direct_aiplatform_veo3()
-    
-    # Test alternatives
-    result2 = test_alternative_veo3_access()
+    # Test direct approach and alternatives together
+    result1, result2 = asyncio.run(run_probes())
     
     print("\n" + "=" * 55)
     print("📊 DIRECT AI PLATFORM TEST RESULTS")
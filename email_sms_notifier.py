@@ -5,9 +5,38 @@ Sends SMS alerts when emails are received at support@dreamframe.com
 """
 
 import os
+import time
+import atexit
+import asyncio
+import logging
+import threading
 from datetime import datetime
 from twilio.rest import Client
-from typing import Optional
+from typing import Optional, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Twilio's default limit on simultaneous API requests per account
+MAX_CONCURRENT_SMS = 10
+
+# Inbound email notifications are coalesced: a batch is sent this many
+# seconds after its first email, or as soon as it holds SMS_BATCH_SIZE emails
+SMS_BATCH_TIMEOUT = 5
+SMS_BATCH_SIZE = 10
+
+# (epoch minute, formatted time) for the last formatted timestamp
+_minute_cache = (None, '')
+
+def _formatted_time() -> str:
+    """Current local time as e.g. '03:45 PM', formatted once per minute"""
+    global _minute_cache
+    now = time.time()
+    minute = int(now // 60)
+    cached_minute, formatted = _minute_cache
+    if cached_minute != minute:
+        formatted = datetime.fromtimestamp(now).strftime("%I:%M %p")
+        _minute_cache = (minute, formatted)
+    return formatted
 
 class EmailSMSNotifier:
     def __init__(self):
@@ -25,6 +54,12 @@ class EmailSMSNotifier:
         else:
             self.client = None
             print("❌ Twilio credentials not found")
+        
+        # Pending inbound email notifications, keyed by (from_email, subject)
+        # so repeats within one batch window only notify once
+        self._pending_emails = {}
+        self._batch_lock = threading.Lock()
+        self._batch_timer = None
     
     def send_email_notification(self, from_email: str, subject: str, content: str = "") -> bool:
         """Send SMS notification when email is received"""
@@ -35,7 +70,7 @@ class EmailSMSNotifier:
         
         try:
             # Create notification message
-            timestamp = datetime.now().strftime("%I:%M %p")
+            timestamp = _formatted_time()
             
             # Truncate long content
             preview = content[:100] + "..." if len(content) > 100 else content
@@ -63,6 +98,105 @@ Reply via support@dreamframe.com"""
             print(f"❌ Failed to send SMS notification: {str(e)}")
             return False
     
+    def queue_email_notification(self, from_email: str, subject: str, content: str = "") -> bool:
+        """Queue an inbound email notification, coalescing bursts into one SMS
+        
+        The batch is sent SMS_BATCH_TIMEOUT seconds after its first email, or
+        immediately once it holds SMS_BATCH_SIZE emails. Returns True once the
+        email is queued, since the SMS usually goes out later on a timer
+        thread; a batch sent from this call returns the send result instead.
+        Failed batch sends are logged as errors.
+        """
+        if not self.client:
+            print("SMS notifications not configured")
+            return False
+        
+        batch = None
+        with self._batch_lock:
+            self._pending_emails.setdefault((from_email, subject), (from_email, subject, content))
+            if len(self._pending_emails) >= SMS_BATCH_SIZE:
+                batch = self._take_pending_batch()
+            elif self._batch_timer is None:
+                self._batch_timer = threading.Timer(SMS_BATCH_TIMEOUT, self.flush_email_notifications)
+                self._batch_timer.daemon = True
+                self._batch_timer.start()
+        
+        if batch:
+            return self._send_email_batch(batch)
+        return True
+    
+    def flush_email_notifications(self) -> bool:
+        """Send any queued inbound email notifications now"""
+        with self._batch_lock:
+            batch = self._take_pending_batch()
+        if batch:
+            return self._send_email_batch(batch)
+        return True
+    
+    def _take_pending_batch(self):
+        # Caller holds _batch_lock
+        batch = list(self._pending_emails.values())
+        self._pending_emails.clear()
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        return batch
+    
+    def _send_email_batch(self, batch) -> bool:
+        # Queued callers were already told True, so a failure must be logged
+        sent = self._send_batch_sms(batch)
+        if not sent:
+            logger.error("SMS notification failed for %d queued email(s) from %s",
+                         len(batch), ", ".join(from_email for from_email, _, _ in batch))
+        return sent
+    
+    def _send_batch_sms(self, batch) -> bool:
+        if len(batch) == 1:
+            return self.send_email_notification(*batch[0])
+        
+        try:
+            senders = ", ".join(dict.fromkeys(from_email for from_email, _, _ in batch))
+            subjects = "\n".join(f"• {subject}" for _, subject, _ in batch)
+            
+            message_body = f"""📧 {len(batch)} NEW EMAILS - {_formatted_time()}
+
+From: {senders}
+
+{subjects}
+
+Reply via support@dreamframe.com"""
+            
+            message = self.client.messages.create(
+                body=message_body,
+                from_=self.from_phone,
+                to=self.owner_phone
+            )
+            
+            print(f"✅ SMS notification sent for {len(batch)} emails: {message.sid}")
+            return True
+            
+        except Exception as e:
+            print(f"❌ Failed to send SMS notification: {str(e)}")
+            return False
+    
+    async def send_email_notification_async(self, from_email: str, subject: str, content: str = "") -> bool:
+        """Async variant of send_email_notification that keeps the event loop free"""
+        return await asyncio.to_thread(self.send_email_notification, from_email, subject, content)
+    
+    async def send_email_notifications(self, emails: Iterable[Tuple[str, str, str]]) -> List[bool]:
+        """Send one notification per (from_email, subject, content) concurrently
+        
+        At most MAX_CONCURRENT_SMS messages are in flight at once. Results are
+        returned in the same order as ``emails``.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SMS)
+        
+        async def send_one(email):
+            async with semaphore:
+                return await self.send_email_notification_async(*email)
+        
+        return await asyncio.gather(*(send_one(email) for email in emails))
+    
     def send_urgent_notification(self, alert_type: str, details: str) -> bool:
         """Send urgent business notifications"""
         
@@ -74,7 +208,7 @@ Reply via support@dreamframe.com"""
 
 {details}
 
-Time: {datetime.now().strftime("%I:%M %p")}
+Time: {_formatted_time()}
 Check: support@dreamframe.com"""
             
             message = self.client.messages.create(
@@ -101,7 +235,7 @@ Check: support@dreamframe.com"""
             test_message = f"""DreamFrame SMS Test
 
 SMS notifications working!
-Time: {datetime.now().strftime("%I:%M %p")}
+Time: {_formatted_time()}
 
 You'll get alerts when customers email support@dreamframe.com"""
             
@@ -128,10 +262,14 @@ You'll get alerts when customers email support@dreamframe.com"""
 
 # Initialize global notifier
 sms_notifier = EmailSMSNotifier()
+atexit.register(sms_notifier.flush_email_notifications)
 
 def notify_email_received(from_email: str, subject: str, content: str = "") -> bool:
-    """Helper function to send email notifications"""
-    return sms_notifier.send_email_notification(from_email, subject, content)
+    """Helper function to send email notifications, batched in bursts
+    
+    Returns True once the notification is queued, not when the SMS is sent.
+    """
+    return sms_notifier.queue_email_notification(from_email, subject, content)
 
 def notify_urgent_alert(alert_type: str, details: str) -> bool:
     """Helper function to send urgent notifications"""
@@ -1,73 +1,22 @@
 import os
 import sys
+import ssl
+import html
+import asyncio
+import atexit
 import smtplib
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from typing import Dict, List, Optional
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class DreamFrameEmailSystem:
-    def __init__(self):
-        # Gmail SMTP configuration (much simpler than SendGrid)
-        self.gmail_user = os.environ.get('GMAIL_USER', 'DreamFrameLLC@gmail.com')
-        self.gmail_password = os.environ.get('GMAIL_APP_PASSWORD', '')
-        self.business_email = 'DreamFrameLLC@gmail.com'  # All emails forward here
-        
-        if not self.gmail_password:
-            logger.warning("Gmail App Password not configured - emails will be saved to database only")
-            logger.info("Set GMAIL_APP_PASSWORD environment variable for email functionality")
-        else:
-            logger.info("Gmail email system initialized successfully")
-    
-    def send_email(self, to_email: str, subject: str, html_content: str = None, text_content: str = None) -> bool:
-        """Send email using Gmail SMTP (FREE and reliable)"""
-        if not self.gmail_password:
-            logger.error("Gmail App Password not configured - cannot send email")
-            return False
-        
-        try:
-            # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f'"DreamFrame LLC" <{self.gmail_user}>'  # Proper from format
-            msg['To'] = to_email
-            msg['Subject'] = subject
-            
-            # Add content
-            if html_content:
-                html_part = MIMEText(html_content, 'html')
-                msg.attach(html_part)
-            elif text_content:
-                text_part = MIMEText(text_content, 'plain')
-                msg.attach(text_part)
-            else:
-                logger.error("Either text_content or html_content must be provided")
-                return False
-            
-            # Option B: Port 587 with STARTTLS (troubleshooting alternative)
-            import ssl
-            context = ssl.create_default_context()
-            server = smtplib.SMTP('smtp.gmail.com', 587)
-            server.starttls(context=context)
-            server.login(self.gmail_user, self.gmail_password)
-            server.send_message(msg)
-            server.quit()
-            
-            logger.info(f"Email sent successfully via Gmail to {to_email}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Gmail SMTP error: {e}")
-            return False
-    
-    def send_video_completion_email(self, customer_email: str, customer_name: str, 
-                                  video_title: str, order_id: int) -> bool:
-        """Send video completion notification"""
-        subject = f"Your DreamFrame video '{video_title}' is ready!"
-        
-        html_content = f"""
+# Email bodies are built once at import and filled in with str.format
+VIDEO_COMPLETION_HTML = """
         <html>
         <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
             <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; text-align: center;">
@@ -117,18 +66,8 @@ class DreamFrameEmailSystem:
         </body>
         </html>
         """
-        
-        return self.send_email(
-            to_email=customer_email,
-            subject=subject,
-            html_content=html_content
-        )
-    
-    def send_contact_form_email(self, name: str, email: str, message: str) -> bool:
-        """Send contact form submission"""
-        subject = f"New Contact Form Submission from {name}"
-        
-        html_content = f"""
+
+CONTACT_FORM_HTML = """
         <html>
         <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
             <h2 style="color: #333;">New Contact Form Submission</h2>
@@ -138,12 +77,186 @@ class DreamFrameEmailSystem:
                 <p><strong>Email:</strong> {email}</p>
                 <p><strong>Message:</strong></p>
                 <div style="background: white; padding: 15px; border-radius: 5px; margin-top: 10px;">
-                    {message.replace(chr(10), '<br>')}
+                    {message}
                 </div>
             </div>
         </body>
         </html>
         """
+
+class DreamFrameEmailSystem:
+    def __init__(self):
+        # Gmail SMTP configuration (much simpler than SendGrid)
+        self.gmail_user = os.environ.get('GMAIL_USER', 'DreamFrameLLC@gmail.com')
+        self.gmail_password = os.environ.get('GMAIL_APP_PASSWORD', '')
+        self.business_email = 'DreamFrameLLC@gmail.com'  # All emails forward here
+        
+        if not self.gmail_password:
+            logger.warning("Gmail App Password not configured - emails will be saved to database only")
+            logger.info("Set GMAIL_APP_PASSWORD environment variable for email functionality")
+        else:
+            logger.info("Gmail email system initialized successfully")
+        
+        # One authenticated SMTP session is kept open and shared by all sends,
+        # so the TLS and AUTH handshake is paid once rather than per email
+        self._smtp = None
+        self._smtp_lock = threading.Lock()
+    
+    def _connect(self) -> smtplib.SMTP:
+        # Option B: Port 587 with STARTTLS (troubleshooting alternative)
+        context = ssl.create_default_context()
+        server = smtplib.SMTP('smtp.gmail.com', 587, timeout=30)
+        try:
+            server.starttls(context=context)
+            server.login(self.gmail_user, self.gmail_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+    
+    def _ensure_connection(self) -> smtplib.SMTP:
+        """Return the open SMTP session, reconnecting if the server dropped it"""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._reset_connection()
+        
+        self._smtp = self._connect()
+        return self._smtp
+    
+    def _reset_connection(self):
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except OSError:
+                pass
+            self._smtp = None
+    
+    def close(self):
+        """Close the shared SMTP session, if one is open"""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._reset_connection()
+    
+    def _build_message(self, to_email: str, subject: str, html_content: str = None,
+                       text_content: str = None) -> Optional[MIMEMultipart]:
+        # Create email message
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f'"DreamFrame LLC" <{self.gmail_user}>'  # Proper from format
+        msg['To'] = to_email
+        msg['Subject'] = subject
+        
+        # Add content
+        if html_content:
+            html_part = MIMEText(html_content, 'html')
+            msg.attach(html_part)
+        elif text_content:
+            text_part = MIMEText(text_content, 'plain')
+            msg.attach(text_part)
+        else:
+            logger.error("Either text_content or html_content must be provided")
+            return None
+        
+        return msg
+    
+    def _send_message(self, msg: MIMEMultipart) -> bool:
+        """Send one message on the shared session; the caller holds the lock"""
+        try:
+            server = self._ensure_connection()
+            server.send_message(msg)
+            
+            logger.info(f"Email sent successfully via Gmail to {msg['To']}")
+            return True
+            
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+            # The server refused this message, but the session is still usable
+            logger.error(f"Gmail SMTP error: {e}")
+            return False
+        except Exception as e:
+            self._reset_connection()
+            logger.error(f"Gmail SMTP error: {e}")
+            return False
+    
+    def send_email(self, to_email: str, subject: str, html_content: str = None, text_content: str = None) -> bool:
+        """Send email using Gmail SMTP (FREE and reliable)"""
+        if not self.gmail_password:
+            logger.error("Gmail App Password not configured - cannot send email")
+            return False
+        
+        msg = self._build_message(to_email, subject, html_content, text_content)
+        if msg is None:
+            return False
+        
+        with self._smtp_lock:
+            return self._send_message(msg)
+    
+    async def send_email_async(self, to_email: str, subject: str, html_content: str = None,
+                               text_content: str = None) -> bool:
+        """Async variant of send_email that keeps the event loop free"""
+        return await asyncio.to_thread(self.send_email, to_email, subject, html_content, text_content)
+    
+    def send_bulk(self, emails: List[Dict[str, str]]) -> List[bool]:
+        """Send several emails over one SMTP session
+        
+        Each item holds send_email keyword arguments (to_email, subject and
+        html_content or text_content). Returns one result per email.
+        """
+        if not self.gmail_password:
+            logger.error("Gmail App Password not configured - cannot send email")
+            return [False] * len(emails)
+        
+        messages = [self._build_message(**email) for email in emails]
+        with self._smtp_lock:
+            return [msg is not None and self._send_message(msg) for msg in messages]
+    
+    def _video_completion_email(self, customer_email: str, customer_name: str,
+                                video_title: str, order_id: int) -> Dict[str, str]:
+        """Build the send_email arguments for a video completion notification"""
+        subject = f"Your DreamFrame video '{video_title}' is ready!"
+        
+        html_content = VIDEO_COMPLETION_HTML.format(
+            customer_name=html.escape(customer_name),
+            video_title=html.escape(video_title),
+            order_id=order_id
+        )
+        
+        return {
+            'to_email': customer_email,
+            'subject': subject,
+            'html_content': html_content
+        }
+    
+    def send_video_completion_email(self, customer_email: str, customer_name: str, 
+                                  video_title: str, order_id: int) -> bool:
+        """Send video completion notification"""
+        return self.send_email(**self._video_completion_email(
+            customer_email, customer_name, video_title, order_id
+        ))
+    
+    def send_video_completion_batch(self, orders: List[Dict]) -> List[bool]:
+        """Send completion notifications for several orders over one SMTP session
+        
+        Each order holds the send_video_completion_email arguments
+        (customer_email, customer_name, video_title and order_id).
+        """
+        return self.send_bulk([self._video_completion_email(**order) for order in orders])
+    
+    def send_contact_form_email(self, name: str, email: str, message: str) -> bool:
+        """Send contact form submission"""
+        subject = f"New Contact Form Submission from {name}"
+        
+        html_content = CONTACT_FORM_HTML.format(
+            name=html.escape(name),
+            email=html.escape(email),
+            message=html.escape(message).replace('\n', '<br>')
+        )
         
         return self.send_email(
             to_email=self.business_email,  # Forward to DreamFrameLLC@gmail.com
@@ -153,6 +266,7 @@ class DreamFrameEmailSystem:
 
 # Global email system instance
 email_system = DreamFrameEmailSystem()
+atexit.register(email_system.close)
 
 def send_video_completion_notification(customer_email: str, customer_name: str, 
                                      video_title: str, order_id: int) -> bool:
@@ -3,6 +3,8 @@ Enhanced Payment System for DreamFrame LLC
 Integrates with Stripe and database models
 """
 import os
+import time
+import asyncio
 import stripe
 from datetime import datetime, timedelta
 from models import db, Order, PricingTier, ServiceType, OrderStatus
@@ -11,119 +13,215 @@ import uuid
 
 stripe.api_key = os.environ.get('STRIPE_SECRET_KEY')
 
+# One requests-backed Stripe client for the process. It keeps a pooled
+# requests.Session per thread (Session is not thread-safe to share), so each
+# worker thread reuses its warm TLS connections to api.stripe.com
+stripe.default_http_client = stripe.RequestsClient()
+
+# Pricing changes rarely, so active tiers are cached per service type. The
+# cache is per process: clear_pricing_cache() only reaches the worker that
+# handled the edit, so other gunicorn workers may keep charging the old price
+# for up to PRICING_CACHE_TTL seconds after a change
+PRICING_CACHE_TTL = 30  # seconds
+_PRICING_CACHE = {}  # ServiceType -> (PricingTier, expires_at)
+
+def _get_pricing(service_type: ServiceType):
+    """Return the active pricing tier for a service type, or None"""
+    now = time.monotonic()
+    cached = _PRICING_CACHE.get(service_type)
+    if cached and cached[1] > now:
+        return cached[0]
+    
+    pricing_tier = PricingTier.query.filter_by(
+        service_type=service_type, 
+        active=True
+    ).first()
+    
+    if pricing_tier is not None:
+        # Detach the row so it stays readable after this request's session ends
+        db.session.expunge(pricing_tier)
+        _PRICING_CACHE[service_type] = (pricing_tier, now + PRICING_CACHE_TTL)
+    return pricing_tier
+
+def clear_pricing_cache():
+    """Drop this process's cached pricing tiers; call after pricing is edited
+    
+    Other worker processes pick up the change when their entries expire,
+    within PRICING_CACHE_TTL seconds.
+    """
+    _PRICING_CACHE.clear()
+
 class PaymentProcessor:
     def __init__(self):
         self.stripe_key = os.environ.get('STRIPE_SECRET_KEY')
         if not self.stripe_key:
             current_app.logger.warning("Stripe secret key not found")
     
+    def _create_order(self, service_type: ServiceType, customer_email: str,
+                      customer_name: str, requirements: dict = None):
+        """Add a pending order for the service and return it with its pricing tier"""
+        # Get pricing for service type
+        pricing_tier = _get_pricing(service_type)
+        
+        if not pricing_tier:
+            raise ValueError(f"No active pricing found for {service_type.value}")
+        
+        # Create order in database
+        order_id = f"DF-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+        
+        order = Order()
+        order.order_id = order_id
+        order.customer_email = customer_email
+        order.customer_name = customer_name
+        order.service_type = service_type
+        order.amount = pricing_tier.base_price
+        order.requirements = requirements or {}
+        order.estimated_delivery = datetime.utcnow() + timedelta(days=pricing_tier.delivery_days)
+        
+        db.session.add(order)
+        db.session.flush()  # Get the ID
+        
+        return order, pricing_tier
+    
+    def _checkout_session_params(self, order, pricing_tier, service_type: ServiceType,
+                                 customer_email: str) -> dict:
+        """Build the Stripe checkout session arguments for an order"""
+        domain = os.environ.get('REPLIT_DEV_DOMAIN', 'localhost:5000')
+        protocol = 'https' if 'replit' in domain else 'http'
+        
+        return {
+            'payment_method_types': ['card'],
+            'line_items': [{
+                'price_data': {
+                    'currency': 'usd',
+                    'product_data': {
+                        'name': pricing_tier.tier_name,
+                        'description': f"Video production service - {service_type.value.replace('_', ' ').title()}",
+                    },
+                    'unit_amount': pricing_tier.base_price,
+                },
+                'quantity': 1,
+            }],
+            'mode': 'payment',
+            'success_url': f'{protocol}://{domain}/payment/success?session_id={{CHECKOUT_SESSION_ID}}&order_id={order.id}',
+            'cancel_url': f'{protocol}://{domain}/payment/cancelled?order_id={order.id}',
+            'customer_email': customer_email,
+            'metadata': {
+                'order_id': str(order.id),
+                'service_type': service_type.value
+            }
+        }
+    
+    def _complete_checkout(self, order, checkout_session):
+        """Record the Stripe session on the order and commit it"""
+        # Update order with Stripe session ID
+        order.stripe_session_id = checkout_session.id
+        db.session.commit()
+        
+        return {
+            'success': True,
+            'checkout_url': checkout_session.url,
+            'order_id': order.id,
+            'session_id': checkout_session.id
+        }
+    
+    def _checkout_error(self, e: Exception):
+        db.session.rollback()
+        current_app.logger.error(f"Payment session creation error: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
+    
     def create_checkout_session(self, service_type: ServiceType, customer_email: str, 
                               customer_name: str, requirements: dict = None):
         """Create Stripe checkout session for a service"""
         try:
-            # Get pricing for service type
-            pricing_tier = PricingTier.query.filter_by(
-                service_type=service_type, 
-                active=True
-            ).first()
-            
-            if not pricing_tier:
-                raise ValueError(f"No active pricing found for {service_type.value}")
+            order, pricing_tier = self._create_order(service_type, customer_email, customer_name, requirements)
             
-            # Create order in database
-            order_id = f"DF-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+            # Create Stripe checkout session
+            checkout_session = stripe.checkout.Session.create(
+                **self._checkout_session_params(order, pricing_tier, service_type, customer_email)
+            )
             
-            order = Order()
-            order.order_id = order_id
-            order.customer_email = customer_email
-            order.customer_name = customer_name
-            order.service_type = service_type
-            order.amount = pricing_tier.base_price
-            order.requirements = requirements or {}
-            order.estimated_delivery = datetime.utcnow() + timedelta(days=pricing_tier.delivery_days)
+            return self._complete_checkout(order, checkout_session)
             
-            db.session.add(order)
-            db.session.flush()  # Get the ID
+        except Exception as e:
+            return self._checkout_error(e)
+    
+    async def create_checkout_session_async(self, service_type: ServiceType, customer_email: str,
+                                            customer_name: str, requirements: dict = None):
+        """Async variant of create_checkout_session
+        
+        The Stripe round trip and the database work run on worker threads, so
+        the event loop can serve other checkouts while they wait. to_thread
+        copies the app context, so every step uses this request's db.session.
+        """
+        try:
+            order, pricing_tier = await asyncio.to_thread(
+                self._create_order, service_type, customer_email, customer_name, requirements
+            )
             
             # Create Stripe checkout session
-            domain = os.environ.get('REPLIT_DEV_DOMAIN', 'localhost:5000')
-            protocol = 'https' if 'replit' in domain else 'http'
-            
-            checkout_session = stripe.checkout.Session.create(
-                payment_method_types=['card'],
-                line_items=[{
-                    'price_data': {
-                        'currency': 'usd',
-                        'product_data': {
-                            'name': pricing_tier.tier_name,
-                            'description': f"Video production service - {service_type.value.replace('_', ' ').title()}",
-                        },
-                        'unit_amount': pricing_tier.base_price,
-                    },
-                    'quantity': 1,
-                }],
-                mode='payment',
-                success_url=f'{protocol}://{domain}/payment/success?session_id={{CHECKOUT_SESSION_ID}}&order_id={order.id}',
-                cancel_url=f'{protocol}://{domain}/payment/cancelled?order_id={order.id}',
-                customer_email=customer_email,
-                metadata={
-                    'order_id': str(order.id),
-                    'service_type': service_type.value
-                }
+            checkout_session = await asyncio.to_thread(
+                stripe.checkout.Session.create,
+                **self._checkout_session_params(order, pricing_tier, service_type, customer_email)
             )
             
-            # Update order with Stripe session ID
-            order.stripe_session_id = checkout_session.id
-            db.session.commit()
-            
-            return {
-                'success': True,
-                'checkout_url': checkout_session.url,
-                'order_id': order.id,
-                'session_id': checkout_session.id
-            }
+            return await asyncio.to_thread(self._complete_checkout, order, checkout_session)
             
         except Exception as e:
-            db.session.rollback()
-            current_app.logger.error(f"Payment session creation error: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return await asyncio.to_thread(self._checkout_error, e)
+    
+    def _apply_payment(self, session, order_id: int):
+        """Mark the order paid if the checkout session was paid"""
+        if session.payment_status == 'paid':
+            # Update order status
+            order = Order.query.get(order_id)
+            if order:
+                order.status = OrderStatus.PAID
+                order.stripe_payment_intent_id = session.payment_intent
+                order.updated_at = datetime.utcnow()
+                
+                db.session.commit()
+                
+                return {
+                    'success': True,
+                    'order': order,
+                    'message': 'Payment processed successfully'
+                }
+        
+        return {
+            'success': False,
+            'error': 'Payment not completed'
+        }
+    
+    def _payment_success_error(self, e: Exception):
+        current_app.logger.error(f"Payment success handling error: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
     
     def handle_payment_success(self, session_id: str, order_id: int):
         """Process successful payment"""
         try:
             # Retrieve the checkout session
             session = stripe.checkout.Session.retrieve(session_id)
+            return self._apply_payment(session, order_id)
             
-            if session.payment_status == 'paid':
-                # Update order status
-                order = Order.query.get(order_id)
-                if order:
-                    order.status = OrderStatus.PAID
-                    order.stripe_payment_intent_id = session.payment_intent
-                    order.updated_at = datetime.utcnow()
-                    
-                    db.session.commit()
-                    
-                    return {
-                        'success': True,
-                        'order': order,
-                        'message': 'Payment processed successfully'
-                    }
-            
-            return {
-                'success': False,
-                'error': 'Payment not completed'
-            }
+        except Exception as e:
+            return self._payment_success_error(e)
+    
+    async def handle_payment_success_async(self, session_id: str, order_id: int):
+        """Async variant of handle_payment_success"""
+        try:
+            # Retrieve the checkout session without blocking the event loop
+            session = await asyncio.to_thread(stripe.checkout.Session.retrieve, session_id)
+            return await asyncio.to_thread(self._apply_payment, session, order_id)
             
         except Exception as e:
-            current_app.logger.error(f"Payment success handling error: {str(e)}")
-            return {
-                'success': False,
-                'error': str(e)
-            }
+            return self._payment_success_error(e)
     
     def cancel_order(self, order_id: int):
         """Cancel an order"""
@@ -150,6 +248,10 @@ class PaymentProcessor:
                 'success': False,
                 'error': str(e)
             }
+    
+    async def cancel_order_async(self, order_id: int):
+        """Async variant of cancel_order; the database commit runs on a worker thread"""
+        return await asyncio.to_thread(self.cancel_order, order_id)
 
 # Global instance
 payment_processor = PaymentProcessor()
\ No newline at end of file